@@ -0,0 +1,226 @@
+import os
+import sys
+import json
+import bpy
+import numpy
+
+sys.path.append(os.path.dirname(__file__))
+import curve_file
+
+DEFAULT_TOLERANCE = 0.0001
+
+
+def get_curve_name(fcurve):
+    """
+    Gets the name of the unreal curve for the given fcurve. Custom properties and shape keys use their own names,
+    other fcurves use their data path and array index.
+
+    :param object fcurve: A blender fcurve.
+    :return str: The curve name.
+    """
+    data_path = fcurve.data_path
+    if data_path.startswith('["') and data_path.endswith('"]'):
+        return data_path[2:-2]
+    if data_path.startswith('key_blocks["') and data_path.endswith('"].value'):
+        return data_path[len('key_blocks["'):-len('"].value')]
+    # the index is added to every element, so the first element of an array is not named like the whole array
+    return f'{data_path}_{fcurve.array_index}'
+
+
+def get_fcurve_keys(fcurve):
+    """
+    Gets the frames and values of all the keyframes on an fcurve, without iterating over them in python.
+
+    :param object fcurve: A blender fcurve.
+    :return tuple(numpy.ndarray): The key frames and key values.
+    """
+    key_count = len(fcurve.keyframe_points)
+    coordinates = numpy.empty(key_count * 2, dtype=numpy.float32)
+    fcurve.keyframe_points.foreach_get('co', coordinates)
+    return coordinates[0::2], coordinates[1::2]
+
+
+def sample_fcurve(fcurve, frames):
+    """
+    Bakes an fcurve by evaluating it on each of the given frames.
+
+    :param object fcurve: A blender fcurve.
+    :param numpy.ndarray frames: The frames to evaluate.
+    :return numpy.ndarray: The values on each frame.
+    """
+    values = numpy.empty(len(frames), dtype=numpy.float32)
+    for index, frame in enumerate(frames):
+        values[index] = fcurve.evaluate(frame)
+    return values
+
+
+def remove_redundant_keys(frames, values, tolerance=DEFAULT_TOLERANCE):
+    """
+    Removes the keys that are not needed to keep the curve within the tolerance, using the Ramer-Douglas-Peucker
+    algorithm. Each removed key is checked against the line between the keys that are kept on either side of it, so
+    the error can not add up across a run of removed keys. The first and last keys are always kept.
+
+    :param numpy.ndarray frames: The key frames.
+    :param numpy.ndarray values: The key values.
+    :param float tolerance: The largest value difference a removed key can have.
+    :return tuple(numpy.ndarray): The remaining key frames and key values.
+    """
+    if len(frames) < 3:
+        return frames, values
+
+    keep = numpy.zeros(len(frames), dtype=bool)
+    keep[0] = keep[-1] = True
+    spans = [(0, len(frames) - 1)]
+    while spans:
+        start, end = spans.pop()
+        if end - start < 2:
+            continue
+
+        # the value differences of all the keys in the span are computed at once
+        span = frames[end] - frames[start]
+        if span:
+            weights = (frames[start + 1:end] - frames[start]) / span
+        else:
+            weights = numpy.zeros(end - start - 1, dtype=values.dtype)
+        interpolated_values = values[start] + (values[end] - values[start]) * weights
+        differences = numpy.abs(values[start + 1:end] - interpolated_values)
+
+        index = int(numpy.argmax(differences))
+        if differences[index] > tolerance:
+            split = start + 1 + index
+            keep[split] = True
+            spans.append((start, split))
+            spans.append((split, end))
+    return frames[keep], values[keep]
+
+
+def get_action_curves(action, frame_range=None, tolerance=DEFAULT_TOLERANCE, fcurve_filter=None):
+    """
+    Gets the curves of an action. The keyframes are read as they are, unless a frame range is given, in which case
+    the fcurves are baked on every frame of the range.
+
+    :param object action: A blender action.
+    :param list[int] frame_range: The first and last frames to bake.
+    :param float tolerance: The tolerance used to remove redundant keys, or None to keep all the keys.
+    :param callable fcurve_filter: A function that returns whether an fcurve should be included.
+    :return dict: A dictionary of curve names and their key frames and key values.
+    """
+    frames = None
+    if frame_range:
+        frames = numpy.arange(frame_range[0], frame_range[1] + 1, dtype=numpy.float32)
+
+    curves = {}
+    for fcurve in action.fcurves:
+        if fcurve_filter and not fcurve_filter(fcurve):
+            continue
+
+        if frames is None:
+            curve_frames, curve_values = get_fcurve_keys(fcurve)
+        else:
+            curve_frames, curve_values = frames, sample_fcurve(fcurve, frames)
+
+        if tolerance is not None:
+            curve_frames, curve_values = remove_redundant_keys(curve_frames, curve_values, tolerance)
+        curves[get_curve_name(fcurve)] = (curve_frames, curve_values)
+    return curves
+
+
+def get_object_curves(scene_object, frame_range=None, tolerance=DEFAULT_TOLERANCE):
+    """
+    Gets the custom property curves and shape key curves of an object.
+
+    :param object scene_object: A blender object.
+    :param list[int] frame_range: The first and last frames to bake.
+    :param float tolerance: The tolerance used to remove redundant keys, or None to keep all the keys.
+    :return dict: A dictionary of curve names and their key frames and key values.
+    """
+    curves = {}
+    animation_data = scene_object.animation_data
+    if animation_data and animation_data.action:
+        curves.update(get_action_curves(
+            animation_data.action,
+            frame_range,
+            tolerance,
+            lambda fcurve: fcurve.data_path.startswith('["')
+        ))
+
+    shape_keys = getattr(scene_object.data, 'shape_keys', None)
+    if shape_keys and shape_keys.animation_data and shape_keys.animation_data.action:
+        curves.update(get_action_curves(
+            shape_keys.animation_data.action,
+            frame_range,
+            tolerance,
+            lambda fcurve: fcurve.data_path.startswith('key_blocks[')
+        ))
+    return curves
+
+
+def get_curves_in_seconds(curves, start_frame, scene=None):
+    """
+    Converts the key frames of the given curves to seconds from the start frame.
+
+    :param dict curves: A dictionary of curve names and their key frames and key values.
+    :param float start_frame: The frame that is at zero seconds.
+    :param object scene: The blender scene that has the frame rate. The active scene is used if not provided.
+    :return dict: A dictionary of curve names and their key times and key values.
+    """
+    scene = scene or bpy.context.scene
+    frame_rate = scene.render.fps / scene.render.fps_base
+    return {
+        curve_name: ((frames - start_frame) / frame_rate, values)
+        for curve_name, (frames, values) in curves.items()
+    }
+
+
+def write_curves(file_path, curves, binary=True):
+    """
+    Writes curves to a file that can be imported with import_animation_fcurves.
+
+    :param str file_path: The path to the curve file.
+    :param dict curves: A dictionary of curve names and their key times and key values.
+    :param bool binary: Whether to write a binary curve file or a json file.
+    """
+    if binary:
+        curve_file.write_curves(file_path, curves)
+    else:
+        with open(file_path, 'w') as json_file:
+            json.dump({
+                curve_name: numpy.column_stack((times, values)).tolist()
+                for curve_name, (times, values) in curves.items()
+            }, json_file)
+
+
+def export_object_curves(scene_object, file_path, frame_range=None, tolerance=DEFAULT_TOLERANCE, binary=True):
+    """
+    Exports the custom property curves and shape key curves of an object to a curve file.
+
+    :param object scene_object: A blender object.
+    :param str file_path: The path to the curve file.
+    :param list[int] frame_range: The first and last frames to bake. The keyframes are exported as they are if not
+    provided.
+    :param float tolerance: The tolerance used to remove redundant keys, or None to keep all the keys.
+    :param bool binary: Whether to write a binary curve file or a json file.
+    :return int: The number of exported curves.
+    """
+    start_frame = frame_range[0] if frame_range else bpy.context.scene.frame_start
+    curves = get_object_curves(scene_object, frame_range, tolerance)
+    write_curves(file_path, get_curves_in_seconds(curves, start_frame), binary)
+    return len(curves)
+
+
+def export_action_curves(action, file_path, frame_range=None, tolerance=DEFAULT_TOLERANCE, binary=True):
+    """
+    Exports all the fcurves of an action to a curve file.
+
+    :param object action: A blender action.
+    :param str file_path: The path to the curve file.
+    :param list[int] frame_range: The first and last frames to bake. The keyframes are exported as they are if not
+    provided.
+    :param float tolerance: The tolerance used to remove redundant keys, or None to keep all the keys.
+    :param bool binary: Whether to write a binary curve file or a json file.
+    :return int: The number of exported curves.
+    """
+    start_frame = frame_range[0] if frame_range else bpy.context.scene.frame_start
+    curves = get_action_curves(action, frame_range, tolerance)
+    write_curves(file_path, get_curves_in_seconds(curves, start_frame), binary)
+    return len(curves)
@@ -0,0 +1,124 @@
+import sys
+import mmap
+import array
+import struct
+
+# The binary curve file layout, all little endian:
+#   header: magic (4 bytes), version (uint16), curve count (uint32)
+#   per curve: name length (uint16), key count (uint32), utf-8 name, padding to a 4 byte boundary,
+#              key times (float32 * key count), key values (float32 * key count)
+MAGIC = b'UECV'
+VERSION = 1
+HEADER = struct.Struct('<4sHI')
+CURVE_HEADER = struct.Struct('<HI')
+FLOAT_SIZE = 4
+
+
+def get_padding(offset):
+    """
+    Gets the number of bytes needed to align the given offset to the float size.
+
+    :param int offset: A byte offset in the file.
+    :return int: The number of padding bytes.
+    """
+    return -offset % FLOAT_SIZE
+
+
+def to_float_bytes(values):
+    """
+    Converts a sequence of numbers to little endian float32 bytes.
+
+    :param Any values: A list of numbers, or a numpy array.
+    :return bytes: The packed float32 values.
+    """
+    # numpy arrays are converted without iterating over their values in python
+    if hasattr(values, 'astype'):
+        return values.astype('<f4').tobytes()
+
+    float_array = array.array('f', values)
+    if sys.byteorder == 'big':
+        float_array.byteswap()
+    return float_array.tobytes()
+
+
+def from_float_bytes(buffer):
+    """
+    Converts little endian float32 bytes to a list of floats.
+
+    :param memoryview buffer: The packed float32 values.
+    :return list[float]: The float values.
+    """
+    float_array = array.array('f')
+    float_array.frombytes(buffer)
+    if sys.byteorder == 'big':
+        float_array.byteswap()
+    return float_array.tolist()
+
+
+def is_curve_file(file_path):
+    """
+    Checks whether the given file is a binary curve file.
+
+    :param str file_path: The path to a file.
+    :return bool: Whether the file starts with the binary curve file magic.
+    """
+    with open(file_path, 'rb') as curve_file:
+        return curve_file.read(len(MAGIC)) == MAGIC
+
+
+def write_curves(file_path, curves):
+    """
+    Writes curves to a binary curve file.
+
+    :param str file_path: The path to the binary curve file.
+    :param dict curves: A dictionary of curve names and a tuple of their key times and key values.
+    """
+    with open(file_path, 'wb') as curve_file:
+        curve_file.write(HEADER.pack(MAGIC, VERSION, len(curves)))
+        offset = HEADER.size
+
+        for curve_name, (times, values) in curves.items():
+            if len(times) != len(values):
+                raise ValueError(f'The curve "{curve_name}" does not have the same number of key times and values.')
+
+            name = curve_name.encode('utf-8')
+            padding = get_padding(offset + CURVE_HEADER.size + len(name))
+            curve_file.write(CURVE_HEADER.pack(len(name), len(times)))
+            curve_file.write(name + b'\0' * padding)
+            curve_file.write(to_float_bytes(times))
+            curve_file.write(to_float_bytes(values))
+            offset += CURVE_HEADER.size + len(name) + padding + len(times) * FLOAT_SIZE * 2
+
+
+def read_curves(file_path):
+    """
+    Reads the curves from a binary curve file. The file is memory mapped, so only the curve that is being read is
+    copied out of it.
+
+    :param str file_path: The path to the binary curve file.
+    :return iterator: An iterator of curve names, key times and key values.
+    """
+    with open(file_path, 'rb') as curve_file:
+        with mmap.mmap(curve_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            view = memoryview(mapped_file)
+            try:
+                magic, version, curve_count = HEADER.unpack_from(view, 0)
+                if magic != MAGIC:
+                    raise ValueError(f'"{file_path}" is not a binary curve file.')
+                if version > VERSION:
+                    raise ValueError(f'"{file_path}" has the unsupported curve file version {version}.')
+
+                offset = HEADER.size
+                for _ in range(curve_count):
+                    name_length, key_count = CURVE_HEADER.unpack_from(view, offset)
+                    offset += CURVE_HEADER.size
+                    curve_name = bytes(view[offset:offset + name_length]).decode('utf-8')
+                    offset += name_length + get_padding(offset + name_length)
+
+                    size = key_count * FLOAT_SIZE
+                    times = from_float_bytes(view[offset:offset + size])
+                    values = from_float_bytes(view[offset + size:offset + size * 2])
+                    offset += size * 2
+                    yield curve_name, times, values
+            finally:
+                view.release()
@@ -1,10 +1,17 @@
 import os
 import sys
 import abc
+import json
+import uuid
 import queue
 import time
+import types
+import hashlib
 import logging
 import threading
+import functools
+import contextlib
+import collections.abc
 from http import HTTPStatus
 from xmlrpc.server import SimpleXMLRPCServer, SimpleXMLRPCRequestHandler
 
@@ -14,8 +21,428 @@ from importlib.machinery import SourceFileLoader
 logger = logging.getLogger(__name__)
 
 EXECUTION_QUEUE = queue.Queue()
+JOB_QUEUE = queue.Queue()
+JOBS = {}
+JOBS_LOCK = threading.Lock()
 RETURN_VALUE_NAME = 'RPC_SERVER_RETURN_VALUE'
 ERROR_VALUE_NAME = 'RPC_SERVER_ERROR_VALUE'
+CURRENT_JOB_NAME = 'RPC_SERVER_CURRENT_JOB'
+LAST_TICK_TIME_NAME = 'RPC_SERVER_LAST_TICK_TIME'
+CALL_SCOPE_NAME = 'RPC_SERVER_CALL_SCOPE'
+CALL_STATS = {}
+CALL_STATS_LOCK = threading.Lock()
+CURSORS = {}
+CURSORS_LOCK = threading.Lock()
+CURSOR_KEY = '__rpc_cursor__'
+ARGUMENTS = collections.OrderedDict()
+ARGUMENTS_LOCK = threading.Lock()
+HANDLE_KEY = '__rpc_handle__'
+STORES = {}
+STORES_LOCK = threading.Lock()
+
+
+def get_argument_digest(value):
+    """
+    Gets the content hash of an argument value.
+
+    :param Any value: A marshallable value.
+    :return str: The hash of the value.
+    """
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def resolve_argument(value):
+    """
+    Replaces argument handles with the values they were uploaded with.
+
+    :param Any value: An argument value or an argument handle.
+    :return Any: The resolved value.
+    """
+    if isinstance(value, dict) and list(value.keys()) == [HANDLE_KEY]:
+        digest = value[HANDLE_KEY]
+        with ARGUMENTS_LOCK:
+            if digest not in ARGUMENTS:
+                raise KeyError(f'The argument handle "{digest}" is not in the server argument store.')
+            ARGUMENTS.move_to_end(digest)
+            return ARGUMENTS[digest]
+
+    if isinstance(value, (list, tuple)):
+        return [resolve_argument(element) for element in value]
+    return value
+
+
+def resolve_handles(callable_instance):
+    """
+    Wraps a callable so that argument handles are resolved before it is called.
+
+    :param call callable_instance: A callable.
+    :return callable: The wrapped callable.
+    """
+    @functools.wraps(callable_instance)
+    def resolved_call(*args):
+        return callable_instance(*[resolve_argument(arg) for arg in args])
+
+    return resolved_call
+
+
+def get_call_scope():
+    """
+    Gets a dictionary that lives for the duration of the current call, or of the whole batch when the call was sent
+    in a system.multicall. Callables can use it to share state, like caches, that must not outlive the call. Outside
+    of a call a new empty dictionary is returned.
+
+    :return dict: The call scope.
+    """
+    return globals().get(CALL_SCOPE_NAME, {})
+
+
+def get_store(name):
+    """
+    Gets a named dictionary that lives as long as the server. Callables can use it for state, like caches, that
+    must outlive a call, since the modules they are defined in can be executed again when they are registered.
+
+    :param str name: The name of the store.
+    :return dict: The store.
+    """
+    with STORES_LOCK:
+        return STORES.setdefault(name, {})
+
+
+@contextlib.contextmanager
+def open_call_scope():
+    """
+    Opens a call scope that is discarded when the context exits. If a scope is already open it is reused.
+    """
+    if CALL_SCOPE_NAME in globals():
+        yield globals()[CALL_SCOPE_NAME]
+        return
+
+    globals()[CALL_SCOPE_NAME] = {}
+    try:
+        yield globals()[CALL_SCOPE_NAME]
+    finally:
+        globals().pop(CALL_SCOPE_NAME, None)
+
+
+def scope_call(callable_instance):
+    """
+    Wraps a callable so that it runs in its own call scope.
+
+    :param call callable_instance: A callable.
+    :return callable: The wrapped callable.
+    """
+    @functools.wraps(callable_instance)
+    def scoped_call(*args):
+        with open_call_scope():
+            return callable_instance(*args)
+
+    return scoped_call
+
+
+class Cursor:
+    def __init__(self, iterator):
+        """
+        Initializes a cursor that hands out the items of an iterator in chunks.
+
+        :param iterator iterator: The iterator returned by a callable.
+        """
+        self.id = uuid.uuid4().hex
+        self.iterator = iterator
+        self.last_access_time = time.time()
+
+    def next_chunk(self, chunk_size):
+        """
+        Advances the iterator by up to the given number of items.
+
+        :param int chunk_size: The maximum number of items to get.
+        :return tuple(list, bool): The items and whether the iterator is exhausted.
+        """
+        self.last_access_time = time.time()
+        items = []
+        with open_call_scope():
+            for item in self.iterator:
+                items.append(item)
+                if len(items) >= chunk_size:
+                    return items, False
+        return items, True
+
+    def close(self):
+        """
+        Closes the underlying iterator if it is a generator.
+        """
+        if isinstance(self.iterator, types.GeneratorType):
+            self.iterator.close()
+
+
+def open_cursor(iterator):
+    """
+    Stores the iterator as a cursor so the client can consume it in chunks. Cursors that have not
+    been read from in RPC_CURSOR_TIME_OUT seconds are closed.
+
+    :param iterator iterator: An iterator.
+    :return dict: A marshallable reference to the cursor.
+    """
+    timeout = int(os.environ.get('RPC_CURSOR_TIME_OUT', 600))
+    cursor = Cursor(iterator)
+    with CURSORS_LOCK:
+        for cursor_id, existing_cursor in list(CURSORS.items()):
+            if time.time() - existing_cursor.last_access_time > timeout:
+                CURSORS.pop(cursor_id).close()
+        CURSORS[cursor.id] = cursor
+    return {CURSOR_KEY: cursor.id}
+
+
+def stream_results(callable_instance):
+    """
+    Wraps a callable so that any iterator it returns is exposed as a cursor instead of being marshalled
+    as one response.
+
+    :param call callable_instance: A callable.
+    :return callable: The wrapped callable.
+    """
+    @functools.wraps(callable_instance)
+    def streamed_call(*args):
+        result = callable_instance(*args)
+        if isinstance(result, collections.abc.Iterator):
+            return open_cursor(result)
+        return result
+
+    return streamed_call
+
+
+class JobCancelled(Exception):
+    """
+    Raised when a job was cancelled before it could finish.
+    """
+
+
+class Job:
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    def __init__(self, callable_name, callable_instance, args):
+        """
+        Initializes a job that runs a registered callable outside of the request that submitted it.
+
+        :param str callable_name: The name of the registered callable.
+        :param call callable_instance: A callable.
+        :param list args: The arguments to call the callable with.
+        """
+        self.id = uuid.uuid4().hex
+        self.callable_name = callable_name
+        self.callable_instance = callable_instance
+        self.args = args
+        self.state = Job.QUEUED
+        self.progress = 0.0
+        self.message = ''
+        self.result = None
+        self.error = None
+        self.cancel_requested = False
+        self.submitted_time = time.time()
+        self.started_time = None
+        self.finished_time = None
+        self.done = threading.Event()
+        # guards the state changes of a queued job, since it is started and cancelled from different threads
+        self.lock = threading.Lock()
+
+    def finish(self, state, result=None, error=None):
+        """
+        Stores the outcome of the job and releases anything waiting on it.
+
+        :param str state: The final state of the job.
+        :param Any result: The return value of the callable.
+        :param Exception error: The error raised by the callable.
+        """
+        self.state = state
+        self.result = result
+        self.error = error
+        self.finished_time = time.time()
+        self.done.set()
+
+    def to_dict(self):
+        """
+        Gets a marshallable snapshot of the job.
+
+        :return dict: A dictionary of the job state.
+        """
+        return {
+            'id': self.id,
+            'callable_name': self.callable_name,
+            'state': self.state,
+            'progress': self.progress,
+            'message': self.message,
+            'error': str(self.error) if self.error else None,
+            'submitted_time': self.submitted_time,
+            'started_time': self.started_time,
+            'finished_time': self.finished_time,
+        }
+
+
+def get_current_job():
+    """
+    Gets the job that is currently running in the main thread.
+
+    :return Job: The running job or None if the current call is not a job.
+    """
+    return globals().get(CURRENT_JOB_NAME)
+
+
+def set_job_progress(progress, message=None):
+    """
+    Reports the progress of the running job. This does nothing when the current call is not a job.
+
+    :param float progress: The progress of the job between 0.0 and 1.0.
+    :param str message: An optional message that describes the current step.
+    """
+    job = get_current_job()
+    if job:
+        job.progress = float(progress)
+        if message is not None:
+            job.message = str(message)
+
+
+def is_job_cancelled():
+    """
+    Checks if the client asked to cancel the running job. Long running callables can poll this and
+    raise JobCancelled to stop early.
+
+    :return bool: Whether the running job should stop.
+    """
+    job = get_current_job()
+    return bool(job and job.cancel_requested)
+
+
+def run_job(job):
+    """
+    Runs the given job and stores its outcome on it.
+
+    :param Job job: A job.
+    """
+    # jobs that were cancelled while they were still queued are already finished
+    with job.lock:
+        if job.state != Job.QUEUED:
+            return
+        job.state = Job.RUNNING
+        job.started_time = time.time()
+    globals()[CURRENT_JOB_NAME] = job
+    try:
+        job.finish(Job.FINISHED, result=job.callable_instance(*job.args))
+    except JobCancelled as error:
+        job.finish(Job.CANCELLED, error=error)
+    except Exception as error:
+        job.finish(Job.FAILED, error=error)
+    finally:
+        globals().pop(CURRENT_JOB_NAME, None)
+
+
+class CallStats:
+    def __init__(self):
+        """
+        Initializes the execution metrics of a registered callable.
+        """
+        self.count = 0
+        self.errors = 0
+        self.durations = collections.deque(maxlen=int(os.environ.get('RPC_STATS_SAMPLE_SIZE', 1000)))
+
+    def get_percentile(self, percentile):
+        """
+        Gets a latency percentile from the recorded call durations.
+
+        :param float percentile: The percentile between 0 and 100.
+        :return float: The duration in seconds or None if nothing was recorded.
+        """
+        durations = sorted(self.durations)
+        if not durations:
+            return None
+        index = min(len(durations) - 1, int(round(percentile / 100 * (len(durations) - 1))))
+        return durations[index]
+
+    def to_dict(self):
+        """
+        Gets a marshallable snapshot of the metrics.
+
+        :return dict: A dictionary of the call metrics.
+        """
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'p50': self.get_percentile(50),
+            'p90': self.get_percentile(90),
+            'p99': self.get_percentile(99),
+        }
+
+
+def track_call(callable_name, callable_instance):
+    """
+    Wraps a callable so that its invocations are recorded in the server call stats.
+
+    :param str callable_name: The name the callable is registered under.
+    :param call callable_instance: A callable.
+    :return callable: The wrapped callable.
+    """
+    @functools.wraps(callable_instance)
+    def tracked_call(*args):
+        with CALL_STATS_LOCK:
+            stats = CALL_STATS.setdefault(callable_name, CallStats())
+
+        start_time = time.perf_counter()
+        try:
+            return callable_instance(*args)
+        except Exception:
+            with CALL_STATS_LOCK:
+                stats.errors += 1
+            raise
+        finally:
+            with CALL_STATS_LOCK:
+                stats.count += 1
+                stats.durations.append(time.perf_counter() - start_time)
+
+    return tracked_call
+
+
+def get_process_memory():
+    """
+    Gets the resident memory of the server process.
+
+    :return float: The memory in megabytes or None if it can not be queried on this platform.
+    """
+    try:
+        if sys.platform == 'win32':
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [
+                    ('cb', wintypes.DWORD),
+                    ('PageFaultCount', wintypes.DWORD),
+                    ('PeakWorkingSetSize', ctypes.c_size_t),
+                    ('WorkingSetSize', ctypes.c_size_t),
+                    ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                    ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                    ('PagefileUsage', ctypes.c_size_t),
+                    ('PeakPagefileUsage', ctypes.c_size_t),
+                ]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb)
+            return counters.WorkingSetSize / 1024 ** 2
+
+        if os.path.exists('/proc/self/statm'):
+            with open('/proc/self/statm') as statm:
+                return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 ** 2
+
+        # fall back to the peak memory, which is reported in bytes on macOS
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 ** 2
+    except Exception:
+        return None
 
 
 def run_in_main_thread(callable_instance, *args):
@@ -52,6 +479,9 @@ def execute_queued_calls(*extra_args):
     Runs calls in the execution que till they are gone. Designed to be passed to a
     recurring event in an integration like a timer.
     """
+    # lets the server stats report if the main thread stopped servicing the queue
+    globals()[LAST_TICK_TIME_NAME] = time.time()
+
     while not EXECUTION_QUEUE.empty():
         if RETURN_VALUE_NAME not in globals():
             callable_instance, args = EXECUTION_QUEUE.get()
@@ -62,6 +492,10 @@ def execute_queued_calls(*extra_args):
                 globals()[ERROR_VALUE_NAME] = error
                 raise error
 
+    # only run one job per call so the integration stays responsive while jobs are pending
+    if not JOB_QUEUE.empty():
+        run_job(JOB_QUEUE.get())
+
 
 class AuthenticatedRequestHandler(SimpleXMLRPCRequestHandler):
     def is_authorized(self):
@@ -129,12 +563,28 @@ class BaseRPCServer:
             allow_none=True
         )
         self.is_thread = is_thread
+        self.start_time = time.time()
+        self.callables = {}
+        self.callable_hashes = {}
         self.server.register_function(self.add_new_callable)
+        self.server.register_function(self.add_new_callables)
         self.server.register_function(self.kill)
         self.server.register_function(self.is_running)
         self.server.register_function(self.set_env)
+        self.server.register_function(self.server_stats)
+        self.server.register_function(self.submit)
+        self.server.register_function(self.status)
+        self.server.register_function(self.progress)
+        self.server.register_function(self.wait)
+        self.server.register_function(self.cancel)
+        # cursors advance the iterators of the callables, so they have to run in the same thread as them
+        self.server.register_function(self.thread_safe_call(self.fetch) if is_thread else self.fetch, 'fetch')
+        self.server.register_function(self.close_cursor)
+        self.server.register_function(self.store_argument)
         self.server.register_introspection_functions()
         self.server.register_multicall_functions()
+        # the calls in a batch share one call scope, so the state they cache is built once per batch
+        self.server.register_function(scope_call(self.server.system_multicall), 'system.multicall')
         logger.info(f'Started RPC server "{name}".')
 
     @staticmethod
@@ -154,6 +604,90 @@ class BaseRPCServer:
         """
         os.environ[name] = str(value)
 
+    def server_stats(self):
+        """
+        Gets metrics about the server queues and the calls it has serviced. Monitoring can poll this to detect
+        a main thread that stopped servicing the execution queue.
+
+        Note: The server handles one request at a time, so this is only answered between calls. While a call is
+        waiting on a stalled main thread, the stats are returned once that call has timed out after RPC_TIME_OUT
+        seconds. Jobs run outside of requests, so they are reported while they run.
+
+        :return dict: A dictionary of server metrics.
+        """
+        last_tick_time = globals().get(LAST_TICK_TIME_NAME)
+        with CALL_STATS_LOCK:
+            callables = {name: stats.to_dict() for name, stats in CALL_STATS.items()}
+        for name, source_hash in self.callable_hashes.items():
+            callables.setdefault(name, CallStats().to_dict())['source_hash'] = source_hash
+
+        with JOBS_LOCK:
+            job_count = len(JOBS)
+            running_jobs = len([job for job in JOBS.values() if job.state == Job.RUNNING])
+
+        return {
+            'uptime': time.time() - self.start_time,
+            'queue_depth': EXECUTION_QUEUE.qsize(),
+            'job_queue_depth': JOB_QUEUE.qsize(),
+            'job_count': job_count,
+            'running_jobs': running_jobs,
+            'seconds_since_last_tick': time.time() - last_tick_time if last_tick_time else None,
+            'memory': get_process_memory(),
+            'callables': callables,
+        }
+
+    @staticmethod
+    def fetch(cursor_id, chunk_size):
+        """
+        Fetches the next chunk of items from a cursor. The cursor is closed once it is exhausted.
+
+        :param str cursor_id: The id of the cursor.
+        :param int chunk_size: The maximum number of items to return.
+        :return dict: The items and whether the cursor is exhausted.
+        """
+        with CURSORS_LOCK:
+            cursor = CURSORS.get(cursor_id)
+        if not cursor:
+            raise KeyError(f'The cursor "{cursor_id}" does not exist or was already exhausted.')
+
+        items, done = cursor.next_chunk(max(1, int(chunk_size)))
+        if done:
+            with CURSORS_LOCK:
+                CURSORS.pop(cursor_id, None)
+        return {'items': items, 'done': done}
+
+    @staticmethod
+    def close_cursor(cursor_id):
+        """
+        Closes a cursor before it is exhausted.
+
+        :param str cursor_id: The id of the cursor.
+        :return bool: Whether the cursor was still open.
+        """
+        with CURSORS_LOCK:
+            cursor = CURSORS.pop(cursor_id, None)
+        if cursor:
+            cursor.close()
+        return bool(cursor)
+
+    @staticmethod
+    def store_argument(value):
+        """
+        Stores a large argument on the server so that later calls can pass its handle instead of the value.
+        The store keeps the last RPC_ARGUMENT_STORE_SIZE arguments that were stored or used.
+
+        :param Any value: A marshallable value.
+        :return dict: The content hashed handle of the value.
+        """
+        size = int(os.environ.get('RPC_ARGUMENT_STORE_SIZE', 64))
+        digest = get_argument_digest(value)
+        with ARGUMENTS_LOCK:
+            ARGUMENTS[digest] = value
+            ARGUMENTS.move_to_end(digest)
+            while len(ARGUMENTS) > size:
+                ARGUMENTS.popitem(last=False)
+        return {HANDLE_KEY: digest}
+
     def kill(self):
         """
         Kill the running server from the client. Only if running in blocking mode.
@@ -161,17 +695,113 @@ class BaseRPCServer:
         self.server.quit = True
         return True
 
-    def add_new_callable(self, callable_name, code, client_system_path, remap_pairs=None):
+    @staticmethod
+    def get_job(job_id):
         """
-        Adds a new callable defined in the client to the server.
+        Gets a submitted job.
+
+        :param str job_id: The id of the job.
+        :return Job: The job.
+        """
+        with JOBS_LOCK:
+            job = JOBS.get(job_id)
+        if not job:
+            raise KeyError(f'The job "{job_id}" does not exist or its result was already fetched.')
+        return job
+
+    def submit(self, callable_name, args=None):
+        """
+        Submits a call to a registered callable as a job and returns without waiting for it to finish.
+
+        :param str callable_name: The name of a callable that was added to the server.
+        :param list args: The arguments to call the callable with.
+        :return str: The id of the job.
+        """
+        callable_instance = self.callables.get(callable_name)
+        if not callable_instance:
+            raise ValueError(f'The function "{callable_name}" is not registered with the server.')
+
+        job = Job(callable_name, track_call(callable_name, callable_instance), args or [])
+        with JOBS_LOCK:
+            JOBS[job.id] = job
+
+        # threaded servers hand the job to the main thread, blocking servers run it right away
+        if self.is_thread:
+            JOB_QUEUE.put(job)
+        else:
+            run_job(job)
+        return job.id
+
+    def status(self, job_id):
+        """
+        Gets the status of a job.
+
+        :param str job_id: The id of the job.
+        :return dict: A dictionary of the job state.
+        """
+        return self.get_job(job_id).to_dict()
+
+    def progress(self, job_id):
+        """
+        Gets the progress reported by a job.
+
+        :param str job_id: The id of the job.
+        :return dict: The progress between 0.0 and 1.0 and the last progress message.
+        """
+        job = self.get_job(job_id)
+        return {'progress': job.progress, 'message': job.message}
+
+    def wait(self, job_id, timeout=None):
+        """
+        Waits for a job to finish and fetches its result. Once fetched, the job is removed from the server.
+
+        Note: The server handles one request at a time, so the wait is capped at RPC_JOB_WAIT_SLICE seconds to
+        keep it from blocking every other call. Clients poll this until the job is done.
+
+        :param str job_id: The id of the job.
+        :param float timeout: The number of seconds to wait, up to the wait slice. If None, the wait slice is used.
+        :return: The return value of the job.
+        """
+        job = self.get_job(job_id)
+        wait_slice = float(os.environ.get('RPC_JOB_WAIT_SLICE', 0.1))
+        timeout = wait_slice if timeout is None else min(timeout, wait_slice)
+        if not job.done.wait(timeout):
+            raise TimeoutError(f'The job "{job_id}" did not finish within {timeout} seconds.')
+
+        with JOBS_LOCK:
+            JOBS.pop(job_id, None)
+
+        if job.state == Job.CANCELLED:
+            raise JobCancelled(f'The job "{job_id}" was cancelled.')
+        if job.error:
+            raise job.error
+        return job.result
+
+    def cancel(self, job_id):
+        """
+        Cancels a job. Queued jobs never run, running jobs are asked to stop through is_job_cancelled.
+
+        :param str job_id: The id of the job.
+        :return bool: Whether the job was still pending when it was cancelled.
+        """
+        job = self.get_job(job_id)
+        with job.lock:
+            if job.done.is_set():
+                return False
+
+            job.cancel_requested = True
+            if job.state == Job.QUEUED:
+                job.finish(Job.CANCELLED)
+        return True
+
+    @staticmethod
+    def add_client_system_path(client_system_path, remap_pairs=None):
+        """
+        Adds the python system paths from the client to the server.
 
-        :param str callable_name: The name of the function that will be added to the server.
-        :param str code: The code of the callable that will be added to the server.
         :param list[str] client_system_path: The list of python system paths from the client.
         :param list(tuple) remap_pairs: A list of tuples with first value being the client python path root and the
-        second being the new server path root. This can be useful if the client and server are on two different file
-        systems and the root of the import paths need to be dynamically replaced.
-        :return str: A response message back to the client.
+        second being the new server path root.
         """
         for path in client_system_path:
             # if a list of remap pairs are provided, they will be remapped before being added to the system path
@@ -185,24 +815,74 @@ class BaseRPCServer:
             if path not in sys.path:
                 sys.path.append(path)
 
+    def register_callable(self, callable_name, callable_instance, code):
+        """
+        Registers a callable that was defined by the client with the server.
+
+        :param str callable_name: The name the callable is registered under.
+        :param call callable_instance: A callable.
+        :param str code: The code the callable was defined with.
+        """
+        callable_instance = stream_results(scope_call(resolve_handles(callable_instance)))
+        self.callables[callable_name] = callable_instance
+        self.callable_hashes[callable_name] = hashlib.sha256(code.encode('utf-8')).hexdigest()
+        if self.is_thread:
+            self.server.register_function(
+                track_call(callable_name, self.thread_safe_call(callable_instance)),
+                callable_name
+            )
+        else:
+            self.server.register_function(
+                track_call(callable_name, callable_instance),
+                callable_name
+            )
+
+    def add_new_callable(self, callable_name, code, client_system_path, remap_pairs=None):
+        """
+        Adds a new callable defined in the client to the server.
+
+        :param str callable_name: The name of the function that will be added to the server.
+        :param str code: The code of the callable that will be added to the server.
+        :param list[str] client_system_path: The list of python system paths from the client.
+        :param list(tuple) remap_pairs: A list of tuples with first value being the client python path root and the
+        second being the new server path root. This can be useful if the client and server are on two different file
+        systems and the root of the import paths need to be dynamically replaced.
+        :return str: A response message back to the client.
+        """
+        self.add_client_system_path(client_system_path, remap_pairs)
+
         # run the function code
         exec(code)
         callable_instance = locals().copy().get(callable_name)
 
         # grab it from the locals and register it with the server
         if callable_instance:
-            if self.is_thread:
-                self.server.register_function(
-                    self.thread_safe_call(callable_instance),
-                    callable_name
-                )
-            else:
-                self.server.register_function(
-                    callable_instance,
-                    callable_name
-                )
+            self.register_callable(callable_name, callable_instance, code)
         return f'The function "{callable_name}" has been successfully registered with the server!'
 
+    def add_new_callables(self, preamble, callables, client_system_path, remap_pairs=None):
+        """
+        Adds many callables defined in the client to the server in one request. The preamble is run once and the
+        callables are defined in the namespace it creates, so they share its imports.
+
+        :param str preamble: The import code that the callables depend on.
+        :param dict callables: A dictionary of callable names and the code that defines them.
+        :param list[str] client_system_path: The list of python system paths from the client.
+        :param list(tuple) remap_pairs: A list of tuples with first value being the client python path root and the
+        second being the new server path root.
+        :return str: A response message back to the client.
+        """
+        self.add_client_system_path(client_system_path, remap_pairs)
+
+        namespace = {'__name__': 'rpc_callables'}
+        exec(preamble, namespace)
+        for callable_name, code in callables.items():
+            exec(code, namespace)
+            callable_instance = namespace.get(callable_name)
+            if callable_instance:
+                self.register_callable(callable_name, callable_instance, code)
+        return f'The functions {list(callables.keys())} have been successfully registered with the server!'
+
 
 class BaseRPCServerThread(threading.Thread, BaseRPCServer):
     def __init__(self, name, port):
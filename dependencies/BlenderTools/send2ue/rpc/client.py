@@ -1,7 +1,12 @@
 import os
 import re
+import json
+import time
+import hashlib
 import logging
 import inspect
+import threading
+import collections
 from xmlrpc.client import (
     ServerProxy,
     Unmarshaller,
@@ -12,6 +17,37 @@ from xmlrpc.client import (
 )
 logger = logging.getLogger(__package__)
 
+CURSOR_KEY = '__rpc_cursor__'
+HANDLE_KEY = '__rpc_handle__'
+UPLOADED_ARGUMENTS = collections.OrderedDict()
+UPLOADED_ARGUMENTS_LOCK = threading.Lock()
+
+
+def get_argument_digest(value):
+    """
+    Gets the content hash of an argument value. This matches the hash the server computes.
+
+    :param Any value: A marshallable value.
+    :return str: The hash of the value.
+    """
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def get_argument_handles(args):
+    """
+    Gets all argument handles in the given arguments.
+
+    :param list args: A list of arguments.
+    :return list[str]: The hashes of the argument handles.
+    """
+    digests = []
+    for arg in args:
+        if isinstance(arg, dict) and list(arg.keys()) == [HANDLE_KEY]:
+            digests.append(arg[HANDLE_KEY])
+        elif isinstance(arg, (list, tuple)):
+            digests.extend(get_argument_handles(arg))
+    return digests
+
 
 class RPCUnmarshaller(Unmarshaller):
     def __init__(self, *args, **kwargs):
@@ -98,3 +134,153 @@ class RPCClient:
         )
         self.marshall_exceptions = marshall_exceptions
         self.port = port
+
+    def upload_argument(self, value):
+        """
+        Uploads a large argument to the server once and gets a handle that can be passed to later calls
+        in its place. Uploading the same value again returns the handle without a round trip.
+
+        :param Any value: A marshallable value.
+        :return dict: The content hashed handle of the value.
+        """
+        size = int(os.environ.get('RPC_ARGUMENT_STORE_SIZE', 64))
+        key = (self.port, get_argument_digest(value))
+        with UPLOADED_ARGUMENTS_LOCK:
+            is_uploaded = key in UPLOADED_ARGUMENTS
+
+        if not is_uploaded:
+            self.proxy.store_argument(value)
+
+        with UPLOADED_ARGUMENTS_LOCK:
+            UPLOADED_ARGUMENTS[key] = value
+            UPLOADED_ARGUMENTS.move_to_end(key)
+            while len(UPLOADED_ARGUMENTS) > size:
+                UPLOADED_ARGUMENTS.popitem(last=False)
+        return {HANDLE_KEY: key[1]}
+
+    def restore_arguments(self, args):
+        """
+        Uploads the values of the argument handles in the given arguments again. This is needed when the
+        server was restarted or evicted them from its store.
+
+        :param list args: A list of arguments.
+        :return bool: Whether all the handles could be restored.
+        """
+        digests = get_argument_handles(args)
+        for digest in digests:
+            with UPLOADED_ARGUMENTS_LOCK:
+                value = UPLOADED_ARGUMENTS.get((self.port, digest))
+            if value is None:
+                return False
+            self.proxy.store_argument(value)
+        return bool(digests)
+
+    def resolve_result(self, result):
+        """
+        Resolves the value returned by the server. Iterators that were returned as cursors are
+        turned into a lazy client side iterator.
+
+        :param Any result: The value returned by the server.
+        :return Any: The resolved value.
+        """
+        if isinstance(result, dict) and list(result.keys()) == [CURSOR_KEY]:
+            return RPCCursor(self, result[CURSOR_KEY])
+        return result
+
+
+class RPCCursor:
+    def __init__(self, rpc_client, cursor_id, chunk_size=None):
+        """
+        Initializes a lazy iterator over a cursor on the rpc server.
+
+        :param RPCClient rpc_client: The client the cursor was returned to.
+        :param str cursor_id: The id of the cursor on the server.
+        :param int chunk_size: The number of items fetched per request. Defaults to RPC_CURSOR_CHUNK_SIZE.
+        """
+        self.rpc_client = rpc_client
+        self.id = cursor_id
+        self.chunk_size = chunk_size or int(os.environ.get('RPC_CURSOR_CHUNK_SIZE', 1000))
+        self.done = False
+
+    def __iter__(self):
+        """
+        Fetches the items from the server one chunk at a time.
+        """
+        try:
+            while not self.done:
+                chunk = self.rpc_client.proxy.fetch(self.id, self.chunk_size)
+                self.done = chunk['done']
+                for item in chunk['items']:
+                    yield item
+        finally:
+            # release the iterator on the server if the loop was stopped early
+            self.close()
+
+    def close(self):
+        """
+        Closes the cursor on the server if it was not exhausted.
+        """
+        if not self.done:
+            self.done = True
+            self.rpc_client.proxy.close_cursor(self.id)
+
+
+class RPCJob:
+    def __init__(self, rpc_client, job_id):
+        """
+        Initializes a handle to a job that was submitted to the rpc server.
+
+        :param RPCClient rpc_client: The client the job was submitted with.
+        :param str job_id: The id of the job on the server.
+        """
+        self.rpc_client = rpc_client
+        self.id = job_id
+
+    def status(self):
+        """
+        Gets the status of the job.
+
+        :return dict: A dictionary of the job state.
+        """
+        return self.rpc_client.proxy.status(self.id)
+
+    def progress(self):
+        """
+        Gets the progress reported by the job.
+
+        :return dict: The progress between 0.0 and 1.0 and the last progress message.
+        """
+        return self.rpc_client.proxy.progress(self.id)
+
+    def done(self):
+        """
+        Checks if the job has finished.
+
+        :return bool: Whether the job is no longer queued or running.
+        """
+        return self.status().get('state') not in ['queued', 'running']
+
+    def wait(self, timeout=None):
+        """
+        Waits for the job to finish and fetches its result. The server only waits for a short slice per request,
+        so this polls it until the job is done, leaving the server free to answer other calls in between.
+
+        :param float timeout: The number of seconds to wait. If None, this waits till the job is done.
+        :return: The return value of the job.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            try:
+                return self.rpc_client.resolve_result(self.rpc_client.proxy.wait(self.id, remaining))
+            except TimeoutError:
+                if deadline is not None and time.time() >= deadline:
+                    raise TimeoutError(f'The job "{self.id}" did not finish within {timeout} seconds.')
+
+    def cancel(self):
+        """
+        Cancels the job.
+
+        :return bool: Whether the job was still pending when it was cancelled.
+        """
+        return self.rpc_client.proxy.cancel(self.id)
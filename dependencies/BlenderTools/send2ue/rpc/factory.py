@@ -1,14 +1,20 @@
 import os
 import re
 import sys
+import copy
+import json
+import hashlib
 import logging
+import threading
+import contextlib
+import collections
 import types
 import inspect
 import textwrap
 import unittest
 from xmlrpc.client import Fault
 
-from .client import RPCClient
+from .client import RPCClient, RPCJob, RPCCursor
 from .validations import (
     validate_key_word_parameters,
     validate_class_method,
@@ -20,6 +26,208 @@ from .validations import (
 
 logger = logging.getLogger(__package__)
 
+# the code hashes of the callables that were registered with each server port
+REGISTERED_CALLABLES = {}
+
+
+def get_asset_paths(value):
+    """
+    Gets the asset paths in an argument value. Strings are asset paths, dictionaries are searched for an
+    "asset_path" key and lists are searched element by element.
+
+    :param Any value: An argument value.
+    :return list[str]: A list of asset paths without their object names.
+    """
+    if isinstance(value, str):
+        return [value.split('.')[0]]
+    if isinstance(value, dict):
+        return get_asset_paths(value.get('asset_path'))
+    if isinstance(value, (list, tuple)):
+        return [asset_path for element in value for asset_path in get_asset_paths(element)]
+    return []
+
+
+def get_argument_values(function, args, argument_names):
+    """
+    Gets the values of the named arguments of a call.
+
+    :param callable function: A function reference.
+    :param tuple(Any) args: The function's arguments.
+    :param tuple(str) argument_names: The names of the arguments to get.
+    :return list: A list of argument values.
+    """
+    bound_arguments = inspect.signature(function).bind(*args)
+    bound_arguments.apply_defaults()
+    return [bound_arguments.arguments.get(argument_name) for argument_name in argument_names]
+
+
+class ResultCache:
+    def __init__(self):
+        """
+        Initializes a client side cache for the results of read only remote calls. Results are only cached while
+        a cache scope is open, and cached results are invalidated by bumping the generation of the asset paths that
+        a mutating call touches.
+        """
+        self.depth = 0
+        self.entries = collections.OrderedDict()
+        self.generations = {}
+        self.generation = 0
+        self.in_flight = {}
+        self.lock = threading.Lock()
+
+    def _get_generations(self, port, asset_paths):
+        """
+        Gets the current generation of the given asset paths.
+
+        :param int port: The server port.
+        :param list[str] asset_paths: A list of asset paths.
+        :return tuple(int, dict): The generation of the whole cache and of each asset path.
+        """
+        return self.generation, {path: self.generations.get((port, path), 0) for path in asset_paths}
+
+    def call(self, port, function, args, call_function):
+        """
+        Gets the result of a read only call from the cache, or makes the call and caches it. Identical
+        calls that are made while the first one is in flight wait for its result instead.
+
+        :param int port: The server port.
+        :param callable function: A function tagged with read_only.
+        :param tuple(Any) args: The function's arguments.
+        :param callable call_function: Makes the remote call when the result is not cached.
+        :return Any: The result of the call.
+        """
+        key = (port, function.__name__, json.dumps(args, sort_keys=True, default=str))
+        asset_paths = get_asset_paths(get_argument_values(function, args, function.rpc_read_only))
+
+        while True:
+            with self.lock:
+                entry = self.entries.get(key)
+                if entry and entry[0] == self._get_generations(port, asset_paths):
+                    self.entries.move_to_end(key)
+                    return copy.deepcopy(entry[1])
+
+                event = self.in_flight.get(key)
+                if not event:
+                    event = self.in_flight[key] = threading.Event()
+                    generations = self._get_generations(port, asset_paths)
+                    break
+            # another thread is making the same call, so wait for it and check the cache again
+            event.wait()
+
+        try:
+            result = call_function(function, args)
+            if not isinstance(result, RPCCursor):
+                with self.lock:
+                    self.entries[key] = (generations, copy.deepcopy(result))
+                    while len(self.entries) > int(os.environ.get('RPC_RESULT_CACHE_SIZE', 4096)):
+                        self.entries.popitem(last=False)
+            return result
+        finally:
+            with self.lock:
+                self.in_flight.pop(key, None)
+            event.set()
+
+    def invalidate(self, port, function, args):
+        """
+        Invalidates the cached results that depend on the asset paths a mutating call touched. If the function
+        was not tagged with any argument names, everything is invalidated.
+
+        :param int port: The server port.
+        :param callable function: A function tagged with mutates.
+        :param tuple(Any) args: The function's arguments.
+        """
+        with self.lock:
+            if not function.rpc_mutates:
+                self.generation += 1
+                return
+
+            for asset_path in get_asset_paths(get_argument_values(function, args, function.rpc_mutates)):
+                self.generations[(port, asset_path)] = self.generations.get((port, asset_path), 0) + 1
+
+    def clear(self):
+        """
+        Removes all cached results.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.generation += 1
+
+    def is_open(self):
+        """
+        Checks whether a cache scope is open.
+
+        :return bool: Whether results are cached.
+        """
+        return self.depth > 0
+
+    def open_scope(self):
+        """
+        Opens a cache scope. Nested scopes share the outermost one.
+        """
+        with self.lock:
+            self.depth += 1
+
+    def close_scope(self):
+        """
+        Closes a cache scope. The cached results are removed when the outermost scope is closed.
+        """
+        with self.lock:
+            self.depth = max(0, self.depth - 1)
+            if not self.depth:
+                self.entries.clear()
+                self.generation += 1
+
+
+RESULT_CACHE = ResultCache()
+
+
+def read_only(*argument_names):
+    """
+    A decorator that tags a remote function as a read only query, so its results are cached on the client while a
+    result cache scope is open.
+
+    :param str argument_names: The names of the arguments that hold the asset paths the result depends on.
+    """
+    def decorator(function):
+        function.rpc_read_only = argument_names
+        return function
+    return decorator
+
+
+def mutates(*argument_names):
+    """
+    A decorator that tags a remote function as mutating, so cached results of the assets it touches are
+    invalidated when it is called.
+
+    :param str argument_names: The names of the arguments that hold the asset paths the function changes. If
+    none are given, all cached results are invalidated.
+    """
+    def decorator(function):
+        function.rpc_mutates = argument_names
+        return function
+    return decorator
+
+
+def clear_result_cache():
+    """
+    Clears the cached results of all read only remote calls, i.e. after the assets were changed in the editor.
+    """
+    RESULT_CACHE.clear()
+
+
+@contextlib.contextmanager
+def result_cache():
+    """
+    Caches the results of read only remote calls for the duration of the context, i.e. while validating or syncing
+    assets. Outside of it read only calls always go to the server, so changes made directly in the editor are never
+    hidden by a stale result.
+    """
+    RESULT_CACHE.open_scope()
+    try:
+        yield
+    finally:
+        RESULT_CACHE.close_scope()
+
 
 class RPCFactory:
     def __init__(self, rpc_client, remap_pairs=None, default_imports=None):
@@ -92,7 +300,17 @@ class RPCFactory:
         :param callable function: A callable.
         :return str: The new code of the callable with all its references added.
         """
-        import_code = self.default_imports
+        return textwrap.indent('\n'.join(self._get_import_code(code, function)), ' ' * 4)
+
+    def _get_import_code(self, code, function):
+        """
+        Gets the import lines that make all references of the given code available on the server.
+
+        :param list[str] code: The code of the callable.
+        :param callable function: A callable.
+        :return list[str]: A list of import lines.
+        """
+        import_code = list(self.default_imports)
 
         client_module = inspect.getmodule(function)
         self.file_path = get_source_file_path(function)
@@ -133,13 +351,14 @@ class RPCFactory:
 
                     break
 
-        return textwrap.indent('\n'.join(import_code), ' ' * 4)
+        return import_code
 
-    def _get_code(self, function):
+    def _get_code(self, function, include_imports=True):
         """
         Gets the code from a callable.
 
         :param callable function: A callable.
+        :param bool include_imports: Whether to insert the import code inside the callable.
         :return str: The code of the callable.
         """
         code = textwrap.dedent(inspect.getsource(function)).split('\n')
@@ -149,8 +368,9 @@ class RPCFactory:
         doc_string = self._get_docstring(code, function.__name__)
 
         # get import code and insert them inside the function
-        import_code = self._get_callstack_references(code, function)
-        code.insert(1, import_code)
+        if include_imports:
+            import_code = self._get_callstack_references(code, function)
+            code.insert(1, import_code)
 
         # remove the doc string
         if doc_string:
@@ -159,27 +379,59 @@ class RPCFactory:
 
         return code
 
+    @staticmethod
+    def _get_additional_paths():
+        """
+        Gets the python paths that the server needs to import the client code.
+
+        :return list[str]: A list of python paths.
+        """
+        # if additional paths are explicitly set, then use them. This is useful with the client is on another
+        # machine and the python paths are different
+        additional_paths = list(filter(None, os.environ.get('RPC_ADDITIONAL_PYTHON_PATHS', '').split(',')))
+
+        if not additional_paths:
+            # otherwise use the current system path
+            additional_paths = sys.path
+        return additional_paths
+
+    def _set_registered(self, function_name, code):
+        """
+        Remembers that the given code of a callable is registered with the server.
+
+        :param str function_name: The name of the callable.
+        :param list[str] code: The code of the callable.
+        """
+        code_hash = hashlib.sha256('\n'.join(code).encode('utf-8')).hexdigest()
+        REGISTERED_CALLABLES[(self.rpc_client.port, function_name)] = code_hash
+
+    def _is_registered(self, function_name, code):
+        """
+        Checks if the given code of a callable is already registered with the server.
+
+        :param str function_name: The name of the callable.
+        :param list[str] code: The code of the callable.
+        :return bool: Whether the callable is registered.
+        """
+        code_hash = hashlib.sha256('\n'.join(code).encode('utf-8')).hexdigest()
+        return REGISTERED_CALLABLES.get((self.rpc_client.port, function_name)) == code_hash
+
     def _register(self, function):
         """
-        Registers a given callable with the server.
+        Registers a given callable with the server. This is skipped if the same code was already registered.
 
         :param  callable function: A callable.
         :return: The code of the function.
         :rtype: list
         """
         code = self._get_code(function)
-        try:
-            # if additional paths are explicitly set, then use them. This is useful with the client is on another
-            # machine and the python paths are different
-            additional_paths = list(filter(None, os.environ.get('RPC_ADDITIONAL_PYTHON_PATHS', '').split(',')))
-
-            if not additional_paths:
-                # otherwise use the current system path
-                additional_paths = sys.path
+        if self._is_registered(function.__name__, code):
+            return code
 
+        try:
             response = self.rpc_client.proxy.add_new_callable(
                 function.__name__, '\n'.join(code),
-                additional_paths
+                self._get_additional_paths()
             )
             if os.environ.get('RPC_DEBUG'):
                 logger.debug(response)
@@ -188,8 +440,105 @@ class RPCFactory:
             server_name = os.environ.get(f'RPC_SERVER_{self.rpc_client.port}', self.rpc_client.port)
             raise ConnectionRefusedError(f'No connection could be made with "{server_name}"')
 
+        self._set_registered(function.__name__, code)
         return code
 
+    def register_functions(self, functions):
+        """
+        Registers the given callables with the server in one request. The imports they need are sent once as a
+        shared preamble instead of being inserted into every callable.
+
+        :param list[callable] functions: A list of callables.
+        :return str: The response message from the server.
+        """
+        preamble = ['from importlib.machinery import SourceFileLoader']
+        callables = {}
+        for function in functions:
+            validate_file_is_saved(function)
+            code = self._get_code(function, include_imports=False)
+            for line in self._get_import_code(code, function):
+                if line not in preamble:
+                    preamble.append(line)
+            callables[function.__name__] = '\n'.join(code)
+
+        try:
+            response = self.rpc_client.proxy.add_new_callables(
+                '\n'.join(preamble),
+                callables,
+                self._get_additional_paths()
+            )
+            if os.environ.get('RPC_DEBUG'):
+                logger.debug(response)
+
+        except ConnectionRefusedError:
+            server_name = os.environ.get(f'RPC_SERVER_{self.rpc_client.port}', self.rpc_client.port)
+            raise ConnectionRefusedError(f'No connection could be made with "{server_name}"')
+
+        # mark the callables as registered so that calling them does not register them again
+        for function in functions:
+            self._set_registered(function.__name__, self._get_code(function))
+        return response
+
+    def _call_remote_function(self, function, args):
+        """
+        Calls the remote function. The results of read only functions are cached while a result cache scope is open,
+        and the cached results of the assets that a mutating function touches are invalidated.
+
+        :param callable function: A function reference.
+        :param tuple(Any) args: The function's arguments.
+        :return Any: The resolved return value.
+        """
+        is_read_only = getattr(function, 'rpc_read_only', None) is not None
+        if is_read_only and RESULT_CACHE.is_open() and not os.environ.get('RPC_DISABLE_RESULT_CACHE'):
+            return RESULT_CACHE.call(self.rpc_client.port, function, args, self._call_server)
+
+        try:
+            return self._call_server(function, args)
+        finally:
+            if getattr(function, 'rpc_mutates', None) is not None:
+                RESULT_CACHE.invalidate(self.rpc_client.port, function, args)
+
+    def _call_server(self, function, args):
+        """
+        Calls the function on the server. If the server no longer has the function, i.e. it was restarted, the function
+        is registered again. If an argument handle expired on the server, its value is uploaded again. In both
+        cases the call is retried once.
+
+        :param callable function: A function reference.
+        :param tuple(Any) args: The function's arguments.
+        :return Any: The resolved return value.
+        """
+        remote_function = getattr(self.rpc_client.proxy, function.__name__)
+        try:
+            return self.rpc_client.resolve_result(remote_function(*args))
+        except KeyError as error:
+            if 'argument handle' not in str(error) or not self.rpc_client.restore_arguments(args):
+                raise
+        except Exception as error:
+            if f'method "{function.__name__}" is not supported' not in str(error):
+                raise
+            REGISTERED_CALLABLES.pop((self.rpc_client.port, function.__name__), None)
+            self._register(function)
+        return self.rpc_client.resolve_result(remote_function(*args))
+
+    def _submit_to_server(self, function, args):
+        """
+        Submits the function as a job on the server. If the server no longer has the function, i.e. it was restarted,
+        the function is registered again and the submit is retried once.
+
+        :param callable function: A function reference.
+        :param tuple(Any) args: The function's arguments.
+        :return str: The id of the job.
+        """
+        try:
+            return self.rpc_client.proxy.submit(function.__name__, list(args))
+        except Exception as error:
+            if f'function "{function.__name__}" is not registered with the server' not in str(error):
+                raise
+            REGISTERED_CALLABLES.pop((self.rpc_client.port, function.__name__), None)
+            self._register(function)
+        return self.rpc_client.proxy.submit(function.__name__, list(args))
+
     def run_function_remotely(self, function, args):
         """
         Handles running the given function on remotely.
@@ -200,9 +549,8 @@ class RPCFactory:
         """
         validate_arguments(function, args)
 
-        # get the remote function instance
+        # register the function with the server
         code = self._register(function)
-        remote_function = getattr(self.rpc_client.proxy, function.__name__)
         self._save_execution_history(code, function, args)
 
         current_frame = inspect.currentframe()
@@ -214,17 +562,35 @@ class RPCFactory:
         # call the remote function
         if not self.rpc_client.marshall_exceptions:
             # if exceptions are not marshalled then receive the default Fault
-            return remote_function(*args)
+            return self._call_remote_function(function, args)
 
         # otherwise catch them and add a line link to them
         try:
-            return remote_function(*args)
+            return self._call_remote_function(function, args)
         except Exception as exception:
             stack_trace = str(exception) + get_line_link(function)
             if isinstance(exception, Fault):
                 raise Fault(exception.faultCode, exception.faultString)
             raise exception.__class__(stack_trace).with_traceback(call_traceback)
 
+    def submit_function_remotely(self, function, args):
+        """
+        Handles submitting the given function as a job that runs remotely without blocking the client.
+
+        :param callable function: A function reference.
+        :param tuple(Any) args: The function's arguments.
+        :return RPCJob: A handle to the submitted job.
+        """
+        validate_arguments(function, args)
+
+        code = self._register(function)
+        self._save_execution_history(code, function, args)
+
+        job_id = self._submit_to_server(function, args)
+        if getattr(function, 'rpc_mutates', None) is not None:
+            RESULT_CACHE.invalidate(self.rpc_client.port, function, args)
+        return RPCJob(self.rpc_client, job_id)
+
 
 def remote_call(port, default_imports=None, remap_pairs=None):
     """
@@ -246,7 +612,25 @@ def remote_call(port, default_imports=None, remap_pairs=None):
                 default_imports=default_imports
             )
             return rpc_factory.run_function_remotely(function, args)
+
+        def submit(*args, **kwargs):
+            validate_file_is_saved(function)
+            validate_key_word_parameters(function, kwargs)
+            rpc_factory = RPCFactory(
+                rpc_client=RPCClient(port),
+                remap_pairs=remap_pairs,
+                default_imports=default_imports
+            )
+            return rpc_factory.submit_function_remotely(function, args)
+
+        # lets long running calls be submitted as jobs i.e. function.submit(*args).wait(timeout)
+        wrapper.submit = submit
         return wrapper
+
+    # keep the settings so that remote classes can register all their methods at once
+    decorator.port = port
+    decorator.default_imports = default_imports
+    decorator.remap_pairs = remap_pairs
     return decorator
 
 
@@ -258,14 +642,36 @@ def remote_class(decorator):
     :return: A decorated class.
     """
     def decorate(cls):
+        functions = []
         for attribute, value in cls.__dict__.items():
             validate_class_method(cls, value)
             if callable(getattr(cls, attribute)):
+                functions.append(getattr(cls, attribute))
                 setattr(cls, attribute, decorator(getattr(cls, attribute)))
+
+        # keep the undecorated methods so that register_remote_class can send them all in one request
+        cls.rpc_functions = functions
+        cls.rpc_decorator = decorator
         return cls
     return decorate
 
 
+def register_remote_class(cls):
+    """
+    Registers every method of a remote class with the server in one request, instead of registering each one
+    on its first call.
+
+    :param type cls: A class decorated with remote_class.
+    :return str: The response message from the server.
+    """
+    rpc_factory = RPCFactory(
+        rpc_client=RPCClient(cls.rpc_decorator.port),
+        remap_pairs=cls.rpc_decorator.remap_pairs,
+        default_imports=cls.rpc_decorator.default_imports
+    )
+    return rpc_factory.register_functions(cls.rpc_functions)
+
+
 class RPCTestCase(unittest.TestCase):
     """
     Subclasses unittest.TestCase to implement a RPC compatible TestCase.
@@ -4,13 +4,18 @@ import os
 import json
 import time
 import sys
+import uuid
+import hashlib
 import inspect
+import contextlib
 from xmlrpc.client import ProtocolError
 from http.client import RemoteDisconnected
 
 sys.path.append(os.path.dirname(__file__))
 import rpc.factory
+import rpc.base_server
 import remote_execution
+import curve_file
 
 try:
     import unreal
@@ -18,7 +23,11 @@ except ModuleNotFoundError:
     pass
 
 REMAP_PAIRS = []
+INSTANCES_ACTOR_TAG = 'UEHelperInstances'
+ASSET_INFO_FIELDS = ['type', 'lod_count', 'collision', 'morph_targets', 'material_slots', 'origin']
 UNREAL_PORT = int(os.environ.get('UNREAL_PORT', 9998))
+IMPORT_MANIFEST_FILE_NAME = 'UEHelperImportManifest.json'
+SETTINGS_CACHE_SIZE = int(os.environ.get('UNREAL_SETTINGS_CACHE_SIZE', 256))
 
 # use a different remap pairs when inside a container
 if os.environ.get('TEST_ENVIRONMENT'):
@@ -33,6 +42,7 @@ remote_unreal_decorator = rpc.factory.remote_call(
 )
 rpc_client = rpc.client.RPCClient(port=UNREAL_PORT)
 unreal_response = ''
+transaction_token = None
 
 
 def get_response():
@@ -181,6 +191,27 @@ def set_rpc_env(key, value):
     rpc_client.proxy.set_env(key, value)
 
 
+def upload_argument(value):
+    """
+    Uploads a large argument, like the property data, to the unreal RPC server once. The returned handle can
+    be passed to the remote calls in place of the value.
+
+    :param Any value: A marshallable value.
+    :return dict: The handle of the value.
+    """
+    return rpc_client.upload_argument(value)
+
+
+def result_cache():
+    """
+    Caches the results of the read only unreal remote calls for the duration of the context, i.e. while validating
+    or syncing assets.
+
+    :return contextmanager: The result cache scope.
+    """
+    return rpc.factory.result_cache()
+
+
 def bootstrap_unreal_with_rpc_server():
     """
     Bootstraps the running unreal editor with the unreal rpc server if it doesn't already exist.
@@ -208,6 +239,41 @@ def bootstrap_unreal_with_rpc_server():
             if result:
                 raise ConnectionError(result)
 
+            # send all the remote calls in one request, rather than each one on its first call
+            register_remote_calls()
+
+
+@contextlib.contextmanager
+def editor_transaction(description='Send to Unreal'):
+    """
+    Wraps the remote calls made in this context in one unreal editor transaction. The assets they save are saved
+    once when the context exits, even if an error is raised, since the changes already made can not be rolled back.
+    Nested contexts are merged into the outermost one.
+
+    :param str description: The description of the transaction in the unreal undo history.
+    """
+    global transaction_token
+    outer_transaction_token = transaction_token
+    transaction_token = UnrealRemoteCalls.begin_transaction(description, outer_transaction_token)
+    try:
+        yield
+    except Exception:
+        # an error from closing the transaction must not hide the error raised in the context
+        with contextlib.suppress(Exception):
+            UnrealRemoteCalls.end_transaction(transaction_token)
+        raise
+    else:
+        UnrealRemoteCalls.end_transaction(transaction_token)
+    finally:
+        transaction_token = outer_transaction_token
+
+
+def register_remote_calls():
+    """
+    Registers all the unreal remote calls with the unreal RPC server in one request.
+    """
+    rpc.factory.register_remote_class(UnrealRemoteCalls)
+
 
 class Unreal:
     @staticmethod
@@ -264,6 +330,110 @@ class Unreal:
         else:
             return value
 
+    @staticmethod
+    def load_asset(asset_path):
+        """
+        Loads an unreal asset. Loaded assets are cached for the duration of the current rpc call, so each asset path
+        is only resolved once per call.
+
+        :param str asset_path: The unreal project path of an asset.
+        :return object: The unreal asset, or None if it does not exist.
+        """
+        loaded_assets = rpc.base_server.get_call_scope().setdefault('loaded_assets', {})
+        asset = loaded_assets.get(asset_path)
+        if not asset:
+            asset = unreal.load_asset(asset_path)
+            # missing assets are not cached, since they might be created later in the same call
+            if asset:
+                loaded_assets[asset_path] = asset
+        return asset
+
+    @staticmethod
+    def unload_assets(path=None):
+        """
+        Removes assets from the cache of loaded assets.
+
+        :param str path: A project path to an asset or folder. All cached assets are removed if not provided.
+        """
+        loaded_assets = rpc.base_server.get_call_scope().get('loaded_assets', {})
+        if path is None:
+            loaded_assets.clear()
+            return
+
+        package_name = path.split('.')[0].rstrip('/')
+        for asset_path in list(loaded_assets):
+            cached_package_name = asset_path.split('.')[0]
+            if cached_package_name == package_name or cached_package_name.startswith(f'{package_name}/'):
+                loaded_assets.pop(asset_path)
+
+    @staticmethod
+    def get_editor_subsystem(subsystem_class):
+        """
+        Gets an editor subsystem. Subsystems are cached for the duration of the current rpc call.
+
+        :param type(Class) subsystem_class: The class of the editor subsystem.
+        :return object: The editor subsystem.
+        """
+        editor_subsystems = rpc.base_server.get_call_scope().setdefault('editor_subsystems', {})
+        if subsystem_class not in editor_subsystems:
+            editor_subsystems[subsystem_class] = unreal.get_editor_subsystem(subsystem_class)
+        return editor_subsystems[subsystem_class]
+
+    @staticmethod
+    def get_transaction():
+        """
+        Gets the open editor transaction.
+
+        :return dict: The open transaction, or None if no transaction is open.
+        """
+        return rpc.base_server.get_store('transaction') or None
+
+    @staticmethod
+    def close_transaction():
+        """
+        Closes the open editor transaction, so its changes can be undone in one step, and saves the assets that were
+        saved or changed while it was open.
+
+        :return list[str]: The paths of the saved assets.
+        """
+        transaction = rpc.base_server.get_store('transaction')
+        if not transaction:
+            return []
+
+        scoped_transaction = transaction['scoped_transaction']
+        assets = transaction['assets']
+        transaction.clear()
+
+        scoped_transaction.__exit__(None, None, None)
+        if assets:
+            unreal.EditorAssetLibrary.save_loaded_assets(list(assets.values()), only_if_is_dirty=False)
+        return list(assets)
+
+    @staticmethod
+    def save_asset(asset):
+        """
+        Saves an asset. While an editor transaction is open, the asset is saved when the transaction ends instead.
+
+        :param object asset: An unreal asset.
+        """
+        transaction = Unreal.get_transaction()
+        if transaction:
+            transaction['assets'][asset.get_path_name()] = asset
+        else:
+            unreal.EditorAssetLibrary.save_loaded_asset(asset, only_if_is_dirty=False)
+
+    @staticmethod
+    def mark_dirty(asset):
+        """
+        Marks an asset that was changed without being saved. While an editor transaction is open, the asset is saved
+        when the transaction ends.
+
+        :param object asset: An unreal asset.
+        """
+        transaction = Unreal.get_transaction()
+        if transaction:
+            transaction['assets'][asset.get_path_name()] = asset
+
     @staticmethod
     def get_asset(asset_path):
         """
@@ -272,11 +442,168 @@ class Unreal:
         :param str asset_path: The unreal project path of an asset.
         :return str: A list of python commands that will be run by unreal engine.
         """
-        asset = unreal.load_asset(asset_path)
+        asset = Unreal.load_asset(asset_path)
         if not asset:
             raise RuntimeError(f"The {asset_path} does not exist in the project!")
         return asset
 
+    @staticmethod
+    def get_file_digest(file_path):
+        """
+        Gets the content hash of a file.
+
+        :param str file_path: The path to a file on disk.
+        :return str: The hash of the file content.
+        """
+        file_hash = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    @staticmethod
+    def read_project_file(file_path, file_type):
+        """
+        Reads and parses a project file. The parsed file is kept on the server until the file changes on disk, so
+        repeated reads of an unchanged file are a dictionary lookup.
+
+        :param str file_path: The path to the file on disk.
+        :param str file_type: The type of the file, either "json" or "ini".
+        :return Any: The parsed json data, or a ConfigParser instance.
+        """
+        try:
+            file_stat = os.stat(file_path)
+            file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            file_key = None
+
+        project_files = rpc.base_server.get_store('project_files')
+        cached_file = project_files.get(file_path)
+        if file_key and cached_file and cached_file[0] == file_key:
+            return cached_file[1]
+
+        if file_type == 'json':
+            with open(file_path, 'r') as json_file:
+                file_data = json.load(json_file)
+        elif file_type == 'ini':
+            from configparser import ConfigParser
+            # setting strict to False to bypass duplicate keys in the config file
+            file_data = ConfigParser(strict=False)
+            file_data.read(file_path)
+        else:
+            raise ValueError(f'"{file_type}" is not a supported project file type.')
+
+        # missing files are not cached, so they are read again once they are created
+        if file_key:
+            project_files[file_path] = (file_key, file_data)
+        return file_data
+
+    @staticmethod
+    def get_import_manifest():
+        """
+        Gets the import manifest, which holds the source file hash and the settings hash of the last import of each
+        asset. It is read from the project saved folder once, and kept on the server afterwards.
+
+        :return dict: The manifest file path and its entries by asset path.
+        """
+        manifest = rpc.base_server.get_store('import_manifest')
+        if not manifest:
+            file_path = os.path.join(unreal.Paths.project_saved_dir(), IMPORT_MANIFEST_FILE_NAME)
+            entries = {}
+            if os.path.exists(file_path):
+                try:
+                    with open(file_path, 'r') as manifest_file:
+                        entries = json.load(manifest_file)
+                except (OSError, ValueError):
+                    entries = {}
+            manifest.update({'file_path': file_path, 'entries': entries})
+        return manifest
+
+    @staticmethod
+    def update_import_manifest(digests):
+        """
+        Updates the import manifest entries of the given assets and writes the manifest to disk.
+
+        :param dict digests: A dictionary of asset paths and their import hashes, or None to remove their entry.
+        """
+        manifest = Unreal.get_import_manifest()
+        for asset_path, asset_digests in digests.items():
+            if asset_digests:
+                manifest['entries'][asset_path] = asset_digests
+            else:
+                manifest['entries'].pop(asset_path, None)
+
+        os.makedirs(os.path.dirname(manifest['file_path']), exist_ok=True)
+        with open(manifest['file_path'], 'w') as manifest_file:
+            json.dump(manifest['entries'], manifest_file, indent=2)
+
+    @staticmethod
+    def get_import_digests(file_path, asset_data, property_data):
+        """
+        Gets the hashes that decide whether an import can be skipped.
+
+        :param str file_path: The full path to the file to import.
+        :param dict asset_data: A dictionary of import parameters.
+        :param dict property_data: A dictionary representation of the properties.
+        :return dict: The hash of the source file and the hash of the import settings.
+        """
+        return {
+            'source': Unreal.get_file_digest(file_path),
+            'settings': rpc.base_server.get_argument_digest([asset_data, property_data])
+        }
+
+    @staticmethod
+    def is_import_unchanged(asset_data, digests):
+        """
+        Checks whether the asset was last imported from the same file content with the same settings, and still exists.
+
+        :param dict asset_data: A dictionary of import parameters.
+        :param dict digests: The import hashes of the asset.
+        :return bool: Whether the import can be skipped.
+        """
+        asset_path = asset_data.get('asset_path')
+        if not asset_path:
+            return False
+        if Unreal.get_import_manifest()['entries'].get(asset_path) != digests:
+            return False
+        return unreal.EditorAssetLibrary.does_asset_exist(asset_path)
+
+    @staticmethod
+    def get_asset_registry_data(asset_paths):
+        """
+        Gets the asset registry data of the given assets without loading them.
+
+        :param list[str] asset_paths: The unreal project paths of the assets.
+        :return dict: A dictionary of asset paths and their asset data, or None if the asset does not exist.
+        """
+        if not asset_paths:
+            return {}
+
+        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        package_names = list({asset_path.split('.')[0] for asset_path in asset_paths})
+        registry_data = {}
+        for asset_data in asset_registry.get_assets(unreal.ARFilter(package_names=package_names)):
+            registry_data[(str(asset_data.package_name), str(asset_data.asset_name))] = asset_data
+
+        asset_data = {}
+        for asset_path in asset_paths:
+            # an asset path without an object name refers to the asset with the same name as its package
+            package_name, _, asset_name = asset_path.partition('.')
+            asset_data[asset_path] = registry_data.get((package_name, asset_name or package_name.split('/')[-1]))
+        return asset_data
+
+    @staticmethod
+    def get_asset_class_name(asset_data):
+        """
+        Gets the class name of an asset from its asset registry data.
+
+        :param AssetData asset_data: The asset registry data of an asset.
+        :return str: The name of the asset class.
+        """
+        if hasattr(asset_data, 'asset_class_path'):
+            return str(asset_data.asset_class_path.asset_name)
+        return str(asset_data.asset_class)
+
     @staticmethod
     def get_component_handles(blueprint_asset_path):
         """
@@ -287,7 +614,7 @@ class Unreal:
         """
         subsystem = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
 
-        blueprint_asset = unreal.load_asset(blueprint_asset_path)
+        blueprint_asset = Unreal.load_asset(blueprint_asset_path)
         subobject_data_handles = subsystem.k2_gather_subobject_data_for_blueprint(blueprint_asset)
         return subobject_data_handles
 
@@ -303,12 +630,14 @@ class Unreal:
         :return subobjectDataHandle data_handle: The subobject data handle of the groom component.
         """
         bp_subobject_library = unreal.SubobjectDataBlueprintFunctionLibrary
+        groom_asset = Unreal.load_asset(groom_asset_path)
+        binding_asset = Unreal.load_asset(binding_asset_path)
 
         for data_handle in component_handles:
             subobject = bp_subobject_library.get_object(bp_subobject_library.get_data(data_handle))
             if type(subobject) == unreal.GroomComponent:
-                has_groom = subobject.get_editor_property('groom_asset') == unreal.load_asset(groom_asset_path)
-                has_binding = subobject.get_editor_property('binding_asset') == unreal.load_asset(binding_asset_path)
+                has_groom = subobject.get_editor_property('groom_asset') == groom_asset
+                has_binding = subobject.get_editor_property('binding_asset') == binding_asset
                 if has_groom and has_binding:
                     return data_handle
         return None
@@ -324,11 +653,12 @@ class Unreal:
         :return subobjectDataHandle data_handle: The subobject data handle of the skeletal mesh component.
         """
         bp_subobject_library = unreal.SubobjectDataBlueprintFunctionLibrary
+        mesh_asset = Unreal.load_asset(mesh_asset_path)
 
         for data_handle in component_handles:
             subobject = bp_subobject_library.get_object(bp_subobject_library.get_data(data_handle))
             if type(subobject) == unreal.SkeletalMeshComponent:
-                if subobject.get_skeletal_mesh_asset() == unreal.load_asset(mesh_asset_path):
+                if subobject.get_skeletal_mesh_asset() == mesh_asset:
                     return data_handle
         return None
 
@@ -350,6 +680,78 @@ class Unreal:
         pose = unreal.AnimPoseExtensions.get_anim_pose_at_frame(anim_sequence, frame, pose_options)
         return unreal.AnimPoseExtensions.get_bone_pose(pose, bone_name)
 
+    @staticmethod
+    def get_sequence_track_section(sequence, track_name):
+        """
+        Gets the first section of the first track bound to the given track name in a level sequence.
+
+        :param object sequence: An unreal level sequence object.
+        :param str track_name: The name of the track.
+        :return object: The unreal movie scene section.
+        """
+        bindings = {binding.get_name(): binding for binding in sequence.get_bindings()}
+        binding = bindings.get(track_name)
+        if not binding:
+            raise RuntimeError(f'The track "{track_name}" does not exist in "{sequence.get_path_name()}"!')
+        track = binding.get_tracks()[0]
+        return track.get_sections()[0]
+
+    @staticmethod
+    def clear_section_keyframes(section):
+        """
+        Removes the keys from all the channels of a section in one editor transaction.
+
+        :param object section: An unreal movie scene section.
+        :return int: The number of removed keys.
+        """
+        key_count = 0
+        with unreal.ScopedEditorTransaction('Clear Section Keyframes'):
+            for channel in section.get_channels():
+                keys = channel.get_keys()
+                for key in keys:
+                    channel.remove_key(key)
+                key_count += len(keys)
+        return key_count
+
+    @staticmethod
+    def get_settings_values(property_group):
+        """
+        Gets the unreal values of a group of properties. The converted values are cached on the server by the content
+        hash of the group, so each distinct group is only converted once. Assets are loaded again on every call, since
+        they can be deleted or reimported in between.
+
+        :param dict property_group: A dictionary of properties and their data.
+        :return dict: A dictionary of properties and their unreal values.
+        """
+        # the same group is often used for many assets in a call, so its hash is only computed once per call
+        # the group is kept with its hash, so that its id can not be reused by another group during the call
+        digests = rpc.base_server.get_call_scope().setdefault('settings_digests', {})
+        if id(property_group) not in digests:
+            digests[id(property_group)] = (rpc.base_server.get_argument_digest(property_group), property_group)
+        digest = digests[id(property_group)][0]
+
+        settings_cache = rpc.base_server.get_store('settings')
+        values = settings_cache.get(digest)
+        if values is None:
+            values = {}
+            for attribute, data in property_group.items():
+                if data.get('unreal_type') != 'Asset':
+                    values[attribute] = Unreal.get_value(
+                        value=data.get('value'),
+                        unreal_type=data.get('unreal_type'),
+                    )
+            if len(settings_cache) >= SETTINGS_CACHE_SIZE:
+                settings_cache.clear()
+            settings_cache[digest] = values
+
+        settings_values = {}
+        for attribute, data in property_group.items():
+            if data.get('unreal_type') == 'Asset':
+                settings_values[attribute] = Unreal.get_value(data.get('value'), 'Asset')
+            else:
+                settings_values[attribute] = values[attribute]
+        return settings_values
+
     @staticmethod
     def set_settings(property_group, data_object):
         """
@@ -358,12 +760,7 @@ class Unreal:
         :param dict property_group: A dictionary of properties and their data.
         :param object data_object: A object.
         """
-        for attribute, data in property_group.items():
-            value = Unreal.get_value(
-                value=data.get('value'),
-                unreal_type=data.get('unreal_type'),
-            )
-            data_object.set_editor_property(attribute, value)
+        data_object.set_editor_properties(Unreal.get_settings_values(property_group))
         return data_object
 
     @staticmethod
@@ -383,19 +780,84 @@ class Unreal:
     @staticmethod
     def object_attributes_to_dict(object_instance):
         """
-        Converts the attributes of the given python object to a dictionary.
+        Converts the attributes of the given python object to a dictionary. The names of the attributes with
+        serializable values are found once per class and kept on the server, so later objects of the same class
+        only read those attributes.
 
         :param object object_instance: A object instance.
         :return dict: A dictionary of attributes and values.
         """
         data = {}
         if object_instance:
-            for attribute in dir(object_instance):
+            attribute_schemas = rpc.base_server.get_store('attribute_schemas')
+            attributes = attribute_schemas.get(type(object_instance))
+            if attributes is None:
+                attributes = [
+                    attribute for attribute in dir(object_instance)
+                    if not attribute.startswith("_")
+                    and isinstance(getattr(object_instance, attribute), (bool, str, float, int, list))
+                ]
+                attribute_schemas[type(object_instance)] = attributes
+
+            for attribute in attributes:
                 value = getattr(object_instance, attribute)
-                if isinstance(value, (bool, str, float, int, list)) and not attribute.startswith("_"):
-                    data[attribute] = getattr(object_instance, attribute)
+                if isinstance(value, (bool, str, float, int, list)):
+                    data[attribute] = value
         return data
 
+    @staticmethod
+    def get_asset_info(asset, fields):
+        """
+        Gets the requested metadata fields of a loaded asset.
+
+        :param object asset: An unreal asset.
+        :param list[str] fields: The names of the fields to get. See ASSET_INFO_FIELDS.
+        :return dict: A dictionary of field names and values.
+        """
+        asset_type = asset.__class__.__name__
+        info = {}
+        for field in fields:
+            if field == 'type':
+                info[field] = asset_type
+
+            elif field == 'lod_count':
+                info[field] = 0
+                if asset_type == 'SkeletalMesh':
+                    info[field] = Unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem).get_lod_count(asset)
+                if asset_type == 'StaticMesh':
+                    info[field] = Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem).get_lod_count(asset)
+
+            elif field == 'collision':
+                info[field] = None
+                if asset_type == 'StaticMesh':
+                    static_mesh_subsystem = Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+                    info[field] = {
+                        'simple': static_mesh_subsystem.get_simple_collision_count(asset),
+                        'convex': static_mesh_subsystem.get_convex_collision_count(asset),
+                        'customized': asset.get_editor_property('customized_collision')
+                    }
+
+            elif field == 'morph_targets':
+                info[field] = []
+                if asset_type == 'SkeletalMesh':
+                    info[field] = [str(name) for name in asset.get_all_morph_target_names()]
+
+            elif field == 'material_slots':
+                info[field] = []
+                if asset_type == 'SkeletalMesh':
+                    info[field] = [str(material.material_slot_name) for material in asset.materials]
+                if asset_type == 'StaticMesh':
+                    info[field] = [str(material.material_slot_name) for material in asset.static_materials]
+
+            elif field == 'origin':
+                info[field] = None
+                if hasattr(asset, 'get_bounds'):
+                    info[field] = asset.get_bounds().origin.to_tuple()
+
+            else:
+                raise ValueError(f'"{field}" is not an asset info field. Supported fields are {ASSET_INFO_FIELDS}.')
+        return info
+
     @staticmethod
     def create_asset(asset_path, asset_class=None, asset_factory=None, unique_name=True):
         """
@@ -439,7 +901,7 @@ class Unreal:
             temp_asset_path = f'{binding_asset_path}_Temp'
 
             # renames the existing binding asset (one that had the same name) that will be consolidated
-            existing_binding_asset = unreal.load_asset(binding_asset_path)
+            existing_binding_asset = Unreal.load_asset(binding_asset_path)
             if existing_binding_asset:
                 unreal.EditorAssetLibrary.rename_asset(
                     binding_asset_path,
@@ -540,7 +1002,7 @@ class Unreal:
 
             if skeletal_comp and skeletal_comp_handle:
                 # add imported skeletal mesh asset to skeletal mesh component
-                skeletal_comp.set_skeletal_mesh_asset(unreal.load_asset(mesh_asset_path))
+                skeletal_comp.set_skeletal_mesh_asset(Unreal.load_asset(mesh_asset_path))
 
                 groom_comp, groom_comp_handle = Unreal.create_blueprint_component(
                     blueprint_asset,
@@ -550,8 +1012,8 @@ class Unreal:
                 )
 
                 # add binding asset and groom asset to groom component
-                groom_comp.set_groom_asset(unreal.load_asset(groom_asset_path))
-                groom_comp.set_binding_asset(unreal.load_asset(binding_asset_path))
+                groom_comp.set_groom_asset(Unreal.load_asset(groom_asset_path))
+                groom_comp.set_binding_asset(Unreal.load_asset(binding_asset_path))
         return blueprint_asset_path
 
     @staticmethod
@@ -610,7 +1072,7 @@ class Unreal:
                         # add binding asset and groom asset to groom component
                         groom_component.set_groom_asset(groom_asset)
                         groom_component.set_binding_asset(binding_asset)
-                        unreal.EditorAssetLibrary.save_loaded_asset(blueprint_asset)
+                        Unreal.save_asset(blueprint_asset)
 
                     return str(reference_path)
         # if there is no references to the surface mesh asset, create new blueprint
@@ -620,20 +1082,23 @@ class Unreal:
                 mesh_asset_path,
                 binding_asset_path
             )
-            unreal.EditorAssetLibrary.save_loaded_asset(unreal.load_asset(blueprint_asset_path))
+            Unreal.save_asset(Unreal.load_asset(blueprint_asset_path))
             return blueprint_asset_path
 
     @staticmethod
     def get_assets_on_actor(actor, only_type=None):
         """
-        Gets only actors that are created by directly instancing assets.
+        Gets only actors that are created by directly instancing assets, or that hold the instances of a static mesh.
         """
         assets = []
 
         # only get the asset type specified in only_type if it is provided
         if not only_type or only_type == 'StaticMesh':
+            is_asset_actor = actor.get_class().get_name() == 'StaticMeshActor'
+            # the actors that hold the instances of a static mesh are plain actors with a tag
+            is_asset_actor = is_asset_actor or actor.actor_has_tag(INSTANCES_ACTOR_TAG)
             for component in actor.get_components_by_class(unreal.StaticMeshComponent):
-                if component.static_mesh and actor.get_class().get_name() == 'StaticMeshActor':
+                if component.static_mesh and is_asset_actor:
                     # make sure we only get one unique instance of the asset
                     if component.static_mesh not in assets:
                         assets.append(component.static_mesh)
@@ -660,52 +1125,235 @@ class Unreal:
         Gets actors from the active level that have assets assigned to them.
         """
         actors = []
-        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        actor_subsystem = Unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
 
         for actor in actor_subsystem.get_all_level_actors():
             if Unreal.get_assets_on_actor(actor):
                 actors.append(actor)
         return actors
 
+    @staticmethod
+    def get_asset_actor_index():
+        """
+        Gets the asset actors in the active level by their label. The index is built with one scan of the level
+        per rpc call, or per batch of calls sent in a system.multicall, and the helpers that spawn and destroy actors
+        keep it up to date.
+
+        :return dict: A dictionary of actor labels and actors.
+        """
+        call_scope = rpc.base_server.get_call_scope()
+        if 'asset_actor_index' not in call_scope:
+            asset_actor_index = {}
+            for actor in Unreal.get_asset_actors_in_level():
+                asset_actor_index.setdefault(actor.get_actor_label(), actor)
+            call_scope['asset_actor_index'] = asset_actor_index
+        return call_scope['asset_actor_index']
+
     @staticmethod
     def get_asset_actor_by_label(label):
         """
         Gets the asset actor by the given label.
         """
-        for actor in Unreal.get_asset_actors_in_level():
-            if label == actor.get_actor_label():
-                return actor
+        return Unreal.get_asset_actor_index().get(label)
 
     @staticmethod
     def has_asset_actor_with_label(label):
         """
         Checks if the level has actors with the given label.
         """
+        return label in Unreal.get_asset_actor_index()
+
+    @staticmethod
+    def delete_asset_actors(labels=None, asset_paths=None):
+        """
+        Deletes the asset actors from the active level that match the given labels or asset paths. The actors are
+        collected in one pass over the level, including actors that share a label, and destroyed together in one
+        editor transaction.
+
+        :param list[str] labels: The labels of the actors to delete.
+        :param list[str] asset_paths: The project paths to the assets whose actors should be deleted.
+        :return int: The number of deleted actors.
+        """
+        labels = set(labels) if labels is not None else None
+        asset_paths = {asset_path.split('.')[0] for asset_path in asset_paths} if asset_paths is not None else None
+
+        actors = []
         for actor in Unreal.get_asset_actors_in_level():
-            if label == actor.get_actor_label():
-                return True
-        return False
+            if labels is not None and actor.get_actor_label() not in labels:
+                continue
+            if asset_paths is not None and not any(
+                    asset.get_path_name().split('.')[0] in asset_paths for asset in Unreal.get_assets_on_actor(actor)
+            ):
+                continue
+            actors.append(actor)
+
+        if not actors:
+            return 0
+
+        # the indexes only hold one actor per key, so they are built again the next time they are needed
+        rpc.base_server.get_call_scope().pop('asset_actor_index', None)
+        rpc.base_server.get_call_scope().pop('instances_actor_index', None)
+        with unreal.ScopedEditorTransaction('Delete Asset Actors'):
+            Unreal.get_editor_subsystem(unreal.EditorActorSubsystem).destroy_actors(actors)
+        return len(actors)
 
     @staticmethod
     def delete_all_asset_actors():
         """
         Deletes all actors from the active level that have assets assigned to them.
         """
-        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-        for actor in Unreal.get_asset_actors_in_level():
-            actor_subsystem.destroy_actor(actor)
-            break
+        Unreal.delete_asset_actors()
 
     @staticmethod
     def delete_asset_actor_with_label(label):
         """
         Deletes the actor with the given label.
         """
-        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
-        for actor in Unreal.get_asset_actors_in_level():
-            if label == actor.get_actor_label():
-                actor_subsystem.destroy_actor(actor)
-                break
+        actor_subsystem = Unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        actor = Unreal.get_asset_actor_index().pop(label, None)
+        if actor:
+            actor_subsystem.destroy_actor(actor)
+
+    @staticmethod
+    def get_instances_actor_index():
+        """
+        Gets the actors in the active level that hold the instances of a static mesh, by the asset path of the static
+        mesh. The asset path is stored in a tag on the actor. The index is built with one scan of the level per rpc
+        call.
+
+        :return dict: A dictionary of asset paths and actors.
+        """
+        call_scope = rpc.base_server.get_call_scope()
+        if 'instances_actor_index' not in call_scope:
+            instances_actor_index = {}
+            actor_subsystem = Unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+            for actor in actor_subsystem.get_all_level_actors():
+                if actor.actor_has_tag(INSTANCES_ACTOR_TAG):
+                    for tag in actor.tags:
+                        if str(tag).startswith(f'{INSTANCES_ACTOR_TAG}:'):
+                            instances_actor_index[str(tag)[len(INSTANCES_ACTOR_TAG) + 1:]] = actor
+            call_scope['instances_actor_index'] = instances_actor_index
+        return call_scope['instances_actor_index']
+
+    @staticmethod
+    def delete_instances_actors(asset_paths=None, keep_asset_paths=None):
+        """
+        Deletes the actors that hold the instances of static meshes, with all their instances.
+
+        :param list[str] asset_paths: The project paths to the static meshes whose instances should be deleted. The
+        instances of every static mesh are deleted if not provided.
+        :param list[str] keep_asset_paths: The project paths to the static meshes whose instances should be kept.
+        :return list[str]: The project paths to the static meshes whose instances were deleted.
+        """
+        asset_paths = {asset_path.split('.')[0] for asset_path in asset_paths} if asset_paths is not None else None
+        keep_asset_paths = {asset_path.split('.')[0] for asset_path in keep_asset_paths or []}
+
+        instances_actor_index = Unreal.get_instances_actor_index()
+        deleted_asset_paths = [
+            asset_path for asset_path in instances_actor_index
+            if (asset_paths is None or asset_path in asset_paths) and asset_path not in keep_asset_paths
+        ]
+        if not deleted_asset_paths:
+            return []
+
+        actors = [instances_actor_index.pop(asset_path) for asset_path in deleted_asset_paths]
+        # the holder actors are asset actors too, so their index is built again the next time it is needed
+        rpc.base_server.get_call_scope().pop('asset_actor_index', None)
+        with unreal.ScopedEditorTransaction('Delete Instances'):
+            Unreal.get_editor_subsystem(unreal.EditorActorSubsystem).destroy_actors(actors)
+        return deleted_asset_paths
+
+    @staticmethod
+    def get_actor_transforms(actor):
+        """
+        Gets the world transforms of an asset actor. Actors that hold the instances of a static mesh have the
+        transform of each instance, other actors have the transform of their root component.
+
+        :param Actor actor: An asset actor.
+        :return list[tuple]: A list of world locations, rotations and scales.
+        """
+        if actor.actor_has_tag(INSTANCES_ACTOR_TAG):
+            component = actor.get_component_by_class(unreal.InstancedStaticMeshComponent)
+            transforms = []
+            for index in range(component.get_instance_count() if component else 0):
+                transform = component.get_instance_transform(index, world_space=True)
+                transforms.append((
+                    transform.translation.to_tuple(),
+                    transform.rotation.rotator().to_tuple(),
+                    transform.scale3d.to_tuple()
+                ))
+            return transforms
+
+        root_component = actor.get_editor_property('root_component')
+        return [(
+            root_component.get_world_location().to_tuple(),
+            root_component.get_world_rotation().to_tuple(),
+            root_component.get_world_scale().to_tuple()
+        )]
+
+    @staticmethod
+    def spawn_instances_actor(asset_path, label, component_class):
+        """
+        Spawns an actor at the world origin with an instanced static mesh component as its root.
+
+        :param str asset_path: The project path to the static mesh, without its object name.
+        :param str label: The unreal actor label.
+        :param type(Class) component_class: The class of the instanced static mesh component.
+        :return Actor: The spawned actor.
+        """
+        actor_subsystem = Unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        actor = actor_subsystem.spawn_actor_from_class(unreal.Actor, unreal.Vector(0, 0, 0), transient=False)
+        actor.set_actor_label(label)
+        actor.set_editor_property('tags', [
+            unreal.Name(INSTANCES_ACTOR_TAG),
+            unreal.Name(f'{INSTANCES_ACTOR_TAG}:{asset_path}')
+        ])
+
+        subsystem = unreal.get_engine_subsystem(unreal.SubobjectDataSubsystem)
+        root_handle = subsystem.k2_gather_subobject_data_for_instance(actor)[0]
+        _, fail_reason = subsystem.add_new_subobject(
+            unreal.AddNewSubobjectParams(
+                parent_handle=root_handle,
+                new_class=component_class,
+                blueprint_context=None)
+        )
+        if not fail_reason.is_empty():
+            raise RuntimeError(f"ERROR from sub_object_subsystem.add_new_subobject: {fail_reason}")
+
+        Unreal.get_instances_actor_index()[asset_path] = actor
+        return actor
+
+    @staticmethod
+    def spawn_asset_actor(asset, location, rotation, scale, label):
+        """
+        Spawns an actor of the given asset in the active level and adds it to the asset actor index.
+
+        :param object asset: An unreal asset.
+        :param list location: The unreal actor world location.
+        :param list rotation: The unreal actor world rotation.
+        :param list scale: The unreal actor world scale.
+        :param str label: The unreal actor label.
+        :return Actor: The spawned actor.
+        """
+        actor_subsystem = Unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        actor = actor_subsystem.spawn_actor_from_object(
+            asset,
+            location,
+            rotation=rotation,
+            transient=False
+        )
+        actor.set_actor_label(label)
+        actor.set_actor_transform(
+            new_transform=unreal.Transform(
+                location=location,
+                rotation=rotation,
+                scale=scale
+            ),
+            sweep=False,
+            teleport=True
+        )
+        Unreal.get_asset_actor_index()[label] = actor
+        return actor
 
 
 class UnrealImportAsset(Unreal):
@@ -740,9 +1388,9 @@ class UnrealImportAsset(Unreal):
         default_physics_asset = f'{asset_path}_PhysicsAsset'
         # try to load the provided physics asset
         if physics_asset_path:
-            physics_asset = unreal.load_asset(physics_asset_path)
+            physics_asset = Unreal.load_asset(physics_asset_path)
         else:
-            physics_asset = unreal.load_asset(default_physics_asset)
+            physics_asset = Unreal.load_asset(default_physics_asset)
 
         if physics_asset:
             self._options.create_physics_asset = False
@@ -877,6 +1525,23 @@ class UnrealImportAsset(Unreal):
             not self._property_data.get('advanced_ui_import', {}).get('value', False)
         )
 
+    def get_import_task(self):
+        """
+        Sets the import options for the type of file and gets the import task without running it.
+
+        :return AssetImportTask: The import task.
+        """
+        file_type = os.path.splitext(self._file_path)[-1].lower()
+        if file_type == '.fbx':
+            self.set_fbx_import_task_options()
+        elif file_type == '.abc':
+            self.set_abc_import_task_options()
+        else:
+            raise RuntimeError(f'"{self._file_path}" is not a supported file type to import.')
+
+        self._import_task.options = self._options
+        return self._import_task
+
     def run_import(self):
         # assign the options object to the import task and import the asset
         self._import_task.options = self._options
@@ -950,13 +1615,7 @@ class UnrealImportSequence(Unreal):
         """
         Removes all key frames from the given sequence and track name.
         """
-        bindings = {binding.get_name(): binding for binding in self._sequence.get_bindings()}
-        binding = bindings.get(self._track_name)
-        track = binding.get_tracks()[0]
-        section = track.get_sections()[0]
-        for channel in section.get_channels():
-            for key in channel.get_keys():
-                channel.remove_key(key)
+        self.clear_section_keyframes(self.get_sequence_track_section(self._sequence, self._track_name))
 
     def run_import(self, import_type='control_rig'):
         """
@@ -987,6 +1646,61 @@ class UnrealImportSequence(Unreal):
 @rpc.factory.remote_class(remote_unreal_decorator)
 class UnrealRemoteCalls:
     @staticmethod
+    def begin_transaction(description, token=None):
+        """
+        Opens an editor transaction that stays open across remote calls. The assets that are saved or changed while
+        it is open are saved once when it ends. Passing the token of the open transaction nests the new one into it.
+        Any other open transaction belongs to a client that is gone, so it is closed and its assets are saved first.
+        Transactions have no time out, since a client can spend any amount of time between its calls.
+
+        :param str description: The description of the transaction in the undo history.
+        :param str token: The token of the open transaction to nest into.
+        :return str: The token that end_transaction must be called with.
+        """
+        transaction = Unreal.get_transaction()
+        if transaction and token == transaction['token']:
+            transaction['depth'] += 1
+            return token
+        if transaction:
+            Unreal.close_transaction()
+
+        scoped_transaction = unreal.ScopedEditorTransaction(description)
+        scoped_transaction.__enter__()
+        transaction = rpc.base_server.get_store('transaction')
+        transaction.update({
+            'token': uuid.uuid4().hex,
+            'scoped_transaction': scoped_transaction,
+            'assets': {},
+            'depth': 1
+        })
+        return transaction['token']
+
+    @staticmethod
+    @rpc.factory.mutates()
+    def end_transaction(token):
+        """
+        Closes the editor transaction and saves the assets that were saved or changed while it was open. The changes
+        are kept and can be undone in one step, since the editor can not roll back changes that were already made.
+        A transaction that was already closed, because another client began one, is skipped with a warning.
+
+        :param str token: The token returned by begin_transaction.
+        :return list[str]: The paths of the saved assets.
+        """
+        transaction = Unreal.get_transaction()
+        if not transaction or transaction['token'] != token:
+            unreal.log_warning(
+                f'The editor transaction "{token}" was already closed when another transaction began, and its assets '
+                f'were saved then.'
+            )
+            return []
+
+        transaction['depth'] -= 1
+        if transaction['depth'] > 0:
+            return []
+        return Unreal.close_transaction()
+
+    @staticmethod
+    @rpc.factory.read_only('asset_path')
     def get_lod_count(asset_path):
         """
         Gets the number of lods on the given asset.
@@ -997,25 +1711,74 @@ class UnrealRemoteCalls:
         lod_count = 0
         asset = Unreal.get_asset(asset_path)
         if asset.__class__.__name__ == 'SkeletalMesh':
-            lod_count = unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem).get_lod_count(asset)
+            lod_count = Unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem).get_lod_count(asset)
 
         if asset.__class__.__name__ == 'StaticMesh':
-            lod_count = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem).get_lod_count(asset)
+            lod_count = Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem).get_lod_count(asset)
 
         return lod_count
     @staticmethod
+    @rpc.factory.read_only('asset_path')
     def get_asset_type(asset_path):
         """
         Gets the asset type of the given asset.
 
         :param str asset_path: The path to the unreal asset.
-        :return str: The number of lods on the asset.
+        :return str: The name of the asset class.
         """
-        asset = Unreal.get_asset(asset_path)
-        if asset:
-            return asset.__class__.__name__
+        asset_data = Unreal.get_asset_registry_data([asset_path]).get(asset_path)
+        if not asset_data:
+            raise RuntimeError(f"The {asset_path} does not exist in the project!")
+        return Unreal.get_asset_class_name(asset_data)
+
+    @staticmethod
+    @rpc.factory.read_only('asset_paths')
+    def get_asset_types(asset_paths):
+        """
+        Gets the asset types of many assets from the asset registry without loading them.
+
+        :param list[str] asset_paths: The paths to the unreal assets.
+        :return list[str]: The names of the asset classes, or None for assets that do not exist.
+        """
+        registry_data = Unreal.get_asset_registry_data(asset_paths)
+        return [
+            Unreal.get_asset_class_name(registry_data[asset_path]) if registry_data.get(asset_path) else None
+            for asset_path in asset_paths
+        ]
+
+    @staticmethod
+    @rpc.factory.read_only('asset_paths')
+    def get_assets_info(asset_paths, fields=None):
+        """
+        Gets metadata for many assets in one call. Each asset is loaded once and all the requested fields are
+        computed in a single pass.
+
+        :param list[str] asset_paths: The paths to the unreal assets.
+        :param list[str] fields: The names of the fields to get. Defaults to all of ASSET_INFO_FIELDS.
+        :return dict: The asset paths, whether each asset exists and a list of values per field, in the order
+        of the asset paths. Assets that do not exist have None for every field.
+        """
+        fields = fields or ASSET_INFO_FIELDS
+        columns = {field: [] for field in ['asset_paths', 'exists'] + fields}
+        registry_data = Unreal.get_asset_registry_data(asset_paths)
+        for asset_path in asset_paths:
+            info = {}
+            asset_data = registry_data.get(asset_path)
+            if asset_data:
+                # the type is known from the asset registry, so only load the asset when other fields are needed
+                if set(fields) == {'type'}:
+                    info['type'] = Unreal.get_asset_class_name(asset_data)
+                else:
+                    info = Unreal.get_asset_info(Unreal.load_asset(asset_path), fields)
+
+            columns['asset_paths'].append(asset_path)
+            columns['exists'].append(bool(asset_data))
+            for field in fields:
+                columns[field].append(info.get(field))
+        return columns
 
     @staticmethod
+    @rpc.factory.read_only('asset_path')
     def asset_exists(asset_path):
         """
         Checks to see if an asset exist in unreal.
@@ -1023,7 +1786,19 @@ class UnrealRemoteCalls:
         :param str asset_path: The path to the unreal asset.
         :return bool: Whether the asset exists.
         """
-        return bool(unreal.load_asset(asset_path))
+        return bool(Unreal.get_asset_registry_data([asset_path]).get(asset_path))
+
+    @staticmethod
+    @rpc.factory.read_only('asset_paths')
+    def assets_exist(asset_paths):
+        """
+        Checks to see if many assets exist in unreal, using the asset registry without loading them.
+
+        :param list[str] asset_paths: The paths to the unreal assets.
+        :return list[bool]: Whether each asset exists.
+        """
+        registry_data = Unreal.get_asset_registry_data(asset_paths)
+        return [bool(registry_data.get(asset_path)) for asset_path in asset_paths]
 
     @staticmethod
     def directory_exists(asset_path):
@@ -1033,12 +1808,14 @@ class UnrealRemoteCalls:
         :param str asset_path: The path to the unreal asset.
         :return bool: Whether or not the asset exists.
         """
-        # TODO fix this when the unreal API is fixed where it queries the registry correctly
+        # query the asset registry directly, since unreal.EditorAssetLibrary.does_directory_exist does not
         #  https://jira.it.epicgames.com/browse/UE-142234
-        # return unreal.EditorAssetLibrary.does_directory_exist(asset_path)
-        return True
+        asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+        directory_path = asset_path.rstrip('/')
+        return bool(asset_registry.path_exists(directory_path) or asset_registry.has_assets(directory_path, True))
 
     @staticmethod
+    @rpc.factory.read_only('asset_path')
     def get_static_mesh_collision_info(asset_path):
         """
         Gets the number of convex and simple collisions on a static mesh.
@@ -1048,12 +1825,13 @@ class UnrealRemoteCalls:
         """
         mesh = Unreal.get_asset(asset_path)
         return {
-            'simple': unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem).get_simple_collision_count(mesh),
-            'convex': unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem).get_convex_collision_count(mesh),
+            'simple': Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem).get_simple_collision_count(mesh),
+            'convex': Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem).get_convex_collision_count(mesh),
             'customized': mesh.get_editor_property('customized_collision')
         }
 
     @staticmethod
+    @rpc.factory.read_only('asset_path')
     def get_material_index_by_name(asset_path, material_name):
         """
         Checks to see if an asset has a complex collision.
@@ -1080,10 +1858,7 @@ class UnrealRemoteCalls:
         :returns: Returns a list of missing plugins if any.
         :rtype: list[str]
         """
-        uproject_path = unreal.Paths.get_project_file_path()
-        with open(uproject_path, 'r') as uproject:
-            project_data = json.load(uproject)
-
+        project_data = Unreal.read_project_file(unreal.Paths.get_project_file_path(), 'json')
         return [plugin.get('Name') for plugin in project_data.get('Plugins', {}) if plugin.get('Enabled')]
 
     @staticmethod
@@ -1098,16 +1873,27 @@ class UnrealRemoteCalls:
         :return: Value of the queried setting.
         """
         engine_config_dir = unreal.Paths.project_config_dir()
-        config_path = f'{engine_config_dir}{config_name}.ini'
+        parser = Unreal.read_project_file(f'{engine_config_dir}{config_name}.ini', 'ini')
+        return parser.get(section_name, setting_name, fallback=None)
 
-        from configparser import ConfigParser
-        # setting strict to False to bypass duplicate keys in the config file
-        parser = ConfigParser(strict=False)
-        parser.read(config_path)
+    @staticmethod
+    def get_project_settings_values(queries):
+        """
+        Gets many setting values from the project settings files in one call. Note: method only works correctly
+        with config sections with unique setting names.
 
-        return parser.get(section_name, setting_name, fallback=None)
+        :param list[list[str]] queries: A list of config file names, section names and setting names.
+        :return list: The values of the queried settings, in the order of the queries.
+        """
+        engine_config_dir = unreal.Paths.project_config_dir()
+        values = []
+        for config_name, section_name, setting_name in queries:
+            parser = Unreal.read_project_file(f'{engine_config_dir}{config_name}.ini', 'ini')
+            values.append(parser.get(section_name, setting_name, fallback=None))
+        return values
 
     @staticmethod
+    @rpc.factory.read_only('asset_path')
     def has_socket(asset_path, socket_name):
         """
         Checks to see if an asset has a socket.
@@ -1128,8 +1914,8 @@ class UnrealRemoteCalls:
         :param str groom_asset_path: The path to the unreal groom asset.
         :return bool: Whether the binding asset has the given groom.
         """
-        binding_asset = unreal.load_asset(binding_asset_path)
-        groom_asset = unreal.load_asset(groom_asset_path)
+        binding_asset = Unreal.load_asset(binding_asset_path)
+        groom_asset = Unreal.load_asset(groom_asset_path)
 
         if binding_asset and groom_asset:
             return bool(binding_asset.get_editor_property('groom') == groom_asset)
@@ -1145,8 +1931,8 @@ class UnrealRemoteCalls:
         :param str target_mesh_path: The path to the unreal skeletal mesh asset.
         :return bool: Whether the binding asset has the given skeletal mesh target.
         """
-        binding_asset = unreal.load_asset(binding_asset_path)
-        mesh_asset = unreal.load_asset(target_mesh_path)
+        binding_asset = Unreal.load_asset(binding_asset_path)
+        mesh_asset = Unreal.load_asset(target_mesh_path)
 
         if binding_asset and mesh_asset:
             return bool(binding_asset.get_editor_property('target_skeletal_mesh') == mesh_asset)
@@ -1204,6 +1990,7 @@ class UnrealRemoteCalls:
         return False
 
     @staticmethod
+    @rpc.factory.read_only('asset_path')
     def has_socket_outer(asset_path, socket_name):
         """
         Checks to see if an asset has a socket and the owner (outer) is assigned to the mesh.
@@ -1220,6 +2007,7 @@ class UnrealRemoteCalls:
             return False
 
     @staticmethod
+    @rpc.factory.mutates('asset_path')
     def delete_asset(asset_path):
         """
         Deletes an asset in unreal.
@@ -1228,9 +2016,11 @@ class UnrealRemoteCalls:
         :return bool: Whether the asset was deleted.
         """
         if unreal.EditorAssetLibrary.does_asset_exist(asset_path):
+            Unreal.unload_assets(asset_path)
             unreal.EditorAssetLibrary.delete_asset(asset_path)
 
     @staticmethod
+    @rpc.factory.mutates()
     def delete_directory(directory_path):
         """
         Deletes a folder and its contents in unreal.
@@ -1239,19 +2029,27 @@ class UnrealRemoteCalls:
         :return bool: Whether the directory was deleted.
         """
         if unreal.EditorAssetLibrary.does_directory_exist(directory_path):
+            Unreal.unload_assets(directory_path)
             unreal.EditorAssetLibrary.delete_directory(directory_path)
 
     @staticmethod
+    @rpc.factory.mutates()
     def import_asset(file_path, asset_data, property_data):
         """
-        Imports an asset to unreal based on the asset data in the provided dictionary.
+        Imports an asset to unreal based on the asset data in the provided dictionary. The import is skipped if the
+        asset still exists and was last imported from the same file content with the same settings.
 
         :param str file_path: The full path to the file to import.
         :param dict asset_data: A dictionary of import parameters.
         :param dict property_data: A dictionary representation of the properties.
+        :return dict: The status, either "imported" or "skipped", and the imported object paths.
         """
         # import if valid file_path was provided
         if file_path:
+            digests = Unreal.get_import_digests(file_path, asset_data, property_data)
+            if Unreal.is_import_unchanged(asset_data, digests):
+                return {'status': 'skipped', 'imported_object_paths': []}
+
             unreal_import_asset = UnrealImportAsset(
                 file_path=file_path,
                 asset_data=asset_data,
@@ -1264,9 +2062,84 @@ class UnrealRemoteCalls:
                 unreal_import_asset.set_abc_import_task_options()
 
             # run the import task
-            return unreal_import_asset.run_import()
+            imported_object_paths = unreal_import_asset.run_import()
+            if asset_data.get('asset_path'):
+                Unreal.update_import_manifest({asset_data['asset_path']: digests if imported_object_paths else None})
+            return {'status': 'imported', 'imported_object_paths': imported_object_paths}
 
     @staticmethod
+    @rpc.factory.mutates()
+    def import_assets(entries, property_data):
+        """
+        Imports many assets to unreal by submitting all their import tasks in one call. An entry that fails does
+        not stop the others from being imported, and entries that are unchanged since their last import are skipped.
+
+        :param list entries: A list of (file_path, asset_data) pairs, where asset_data is a dictionary of import
+        parameters.
+        :param dict property_data: A dictionary representation of the properties shared by all the entries.
+        :return list[dict]: The status, either "imported", "skipped" or "failed", the imported object paths and the
+        error of each entry, in the order of the entries.
+        """
+        results = []
+        import_tasks = []
+        for file_path, asset_data in entries:
+            result = {'status': 'failed', 'imported_object_paths': [], 'error': None}
+            results.append(result)
+            try:
+                if not file_path:
+                    raise RuntimeError(f'No file path was given for "{asset_data.get("asset_path")}".')
+
+                digests = Unreal.get_import_digests(file_path, asset_data, property_data)
+                if Unreal.is_import_unchanged(asset_data, digests):
+                    result['status'] = 'skipped'
+                    continue
+
+                unreal_import_asset = UnrealImportAsset(
+                    file_path=file_path,
+                    asset_data=asset_data,
+                    property_data=property_data
+                )
+                import_tasks.append((file_path, asset_data, digests, result, unreal_import_asset.get_import_task()))
+            except Exception as error:
+                result['error'] = str(error)
+
+        if import_tasks:
+            try:
+                unreal.AssetToolsHelpers.get_asset_tools().import_asset_tasks([task[-1] for task in import_tasks])
+            except Exception as error:
+                for _, _, _, result, _ in import_tasks:
+                    result['error'] = str(error)
+                return results
+
+        manifest_digests = {}
+        for file_path, asset_data, digests, result, import_task in import_tasks:
+            result['imported_object_paths'] = [
+                str(object_path) for object_path in import_task.get_editor_property('imported_object_paths')
+            ]
+            if result['imported_object_paths']:
+                result['status'] = 'imported'
+            else:
+                result['error'] = f'"{file_path}" failed to import!'
+            if asset_data.get('asset_path'):
+                manifest_digests[asset_data['asset_path']] = digests if result['imported_object_paths'] else None
+
+        if manifest_digests:
+            Unreal.update_import_manifest(manifest_digests)
+        return results
+
+    @staticmethod
+    def clear_import_manifest(asset_paths=None):
+        """
+        Removes assets from the import manifest, so that their next import is not skipped.
+
+        :param list[str] asset_paths: The project paths to the assets. All the assets are removed if not provided.
+        """
+        if asset_paths is None:
+            asset_paths = list(Unreal.get_import_manifest()['entries'])
+        Unreal.update_import_manifest({asset_path: None for asset_path in asset_paths})
+
+    @staticmethod
+    @rpc.factory.mutates('asset_path')
     def create_asset(asset_path, asset_class=None, asset_factory=None, unique_name=True):
         """
         Creates a new unreal asset.
@@ -1283,6 +2156,7 @@ class UnrealRemoteCalls:
         return unreal_asset
 
     @staticmethod
+    @rpc.factory.mutates()
     def create_binding_asset(groom_asset_path, mesh_asset_path):
         """
         Creates a groom binding asset.
@@ -1294,6 +2168,7 @@ class UnrealRemoteCalls:
         return Unreal.create_binding_asset(groom_asset_path, mesh_asset_path)
 
     @staticmethod
+    @rpc.factory.mutates()
     def create_blueprint_with_groom(groom_asset_path, mesh_asset_path, binding_asset_path):
         """
         Adds a groom component to a blueprint asset with specific skeletal mesh. If queried blueprint asset does not
@@ -1308,6 +2183,7 @@ class UnrealRemoteCalls:
         return Unreal.add_groom_component_to_blueprint(groom_asset_path, mesh_asset_path, binding_asset_path)
 
     @staticmethod
+    @rpc.factory.mutates('asset_path')
     def import_sequence_track(asset_path, file_path, track_name, start=None, end=None):
         """
         Initializes the import with asset data and property data.
@@ -1329,6 +2205,7 @@ class UnrealRemoteCalls:
         unreal_import_sequence.run_import()
 
     @staticmethod
+    @rpc.factory.mutates('asset_path')
     def import_skeletal_mesh_lod(asset_path, file_path, index):
         """
         Imports a lod onto a skeletal mesh.
@@ -1338,12 +2215,13 @@ class UnrealRemoteCalls:
         :param int index: Which lod index to import the lod on.
         """
         skeletal_mesh = Unreal.get_asset(asset_path)
-        skeletal_mesh_subsystem = unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
+        skeletal_mesh_subsystem = Unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
         result = skeletal_mesh_subsystem.import_lod(skeletal_mesh, index, file_path)
         if result == -1:
             raise RuntimeError(f"{file_path} import failed!")
 
     @staticmethod
+    @rpc.factory.mutates('asset_path')
     def import_static_mesh_lod(asset_path, file_path, index):
         """
         Imports a lod onto a static mesh.
@@ -1353,12 +2231,13 @@ class UnrealRemoteCalls:
         :param int index: Which lod index to import the lod on.
         """
         static_mesh = Unreal.get_asset(asset_path)
-        static_mesh_subsystem = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+        static_mesh_subsystem = Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
         result = static_mesh_subsystem.import_lod(static_mesh, index, file_path)
         if result == -1:
             raise RuntimeError(f"{file_path} import failed!")
 
     @staticmethod
+    @rpc.factory.mutates('asset_path')
     def set_skeletal_mesh_lod_build_settings(asset_path, index, property_data):
         """
         Sets the lod build settings for skeletal mesh.
@@ -1368,15 +2247,17 @@ class UnrealRemoteCalls:
         :param dict property_data: A dictionary representation of the properties.
         """
         skeletal_mesh = Unreal.get_asset(asset_path)
-        skeletal_mesh_subsystem = unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
+        skeletal_mesh_subsystem = Unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
         options = unreal.SkeletalMeshBuildSettings()
         options = Unreal.set_settings(
             property_data['unreal']['editor_skeletal_mesh_library']['lod_build_settings'],
             options
         )
         skeletal_mesh_subsystem.set_lod_build_settings(skeletal_mesh, index, options)
+        Unreal.mark_dirty(skeletal_mesh)
 
     @staticmethod
+    @rpc.factory.mutates('asset_path')
     def set_static_mesh_lod_build_settings(asset_path, index, property_data):
         """
         Sets the lod build settings for static mesh.
@@ -1386,15 +2267,59 @@ class UnrealRemoteCalls:
         :param dict property_data: A dictionary representation of the properties.
         """
         static_mesh = Unreal.get_asset(asset_path)
-        static_mesh_subsystem = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+        static_mesh_subsystem = Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
         options = unreal.MeshBuildSettings()
         options = Unreal.set_settings(
             property_data['unreal']['editor_static_mesh_library']['lod_build_settings'],
             options
         )
         static_mesh_subsystem.set_lod_build_settings(static_mesh, index, options)
+        Unreal.mark_dirty(static_mesh)
+
+    @staticmethod
+    @rpc.factory.mutates('asset_path')
+    def import_lods(asset_path, lods):
+        """
+        Imports many lods onto a static or skeletal mesh, sets their build settings and saves the mesh once.
+
+        :param str asset_path: The project path to the mesh in unreal.
+        :param list[list] lods: A list of lod indexes, the paths to their files on disk, and the property data to
+        get their build settings from, or None to keep their current build settings.
+        """
+        mesh = Unreal.get_asset(asset_path)
+        if mesh.__class__.__name__ == 'SkeletalMesh':
+            mesh_subsystem = Unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
+            settings_class = unreal.SkeletalMeshBuildSettings
+            library_name = 'editor_skeletal_mesh_library'
+        elif mesh.__class__.__name__ == 'StaticMesh':
+            mesh_subsystem = Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+            settings_class = unreal.MeshBuildSettings
+            library_name = 'editor_static_mesh_library'
+        else:
+            raise RuntimeError(f'"{asset_path}" is not a static or skeletal mesh!')
+
+        for index, file_path, _ in lods:
+            result = mesh_subsystem.import_lod(mesh, index, file_path)
+            if result == -1:
+                raise RuntimeError(f"{file_path} import failed!")
+
+        # lods that share the same property data share the same build settings object
+        build_settings = {}
+        for index, _, property_data in lods:
+            if not property_data:
+                continue
+            digest = rpc.base_server.get_argument_digest(property_data)
+            if digest not in build_settings:
+                build_settings[digest] = Unreal.set_settings(
+                    property_data['unreal'][library_name]['lod_build_settings'],
+                    settings_class()
+                )
+            mesh_subsystem.set_lod_build_settings(mesh, index, build_settings[digest])
+
+        Unreal.save_asset(mesh)
 
     @staticmethod
+    @rpc.factory.mutates('asset_path')
     def reset_skeletal_mesh_lods(asset_path, property_data):
         """
         Removes all lods on the given skeletal mesh.
@@ -1403,7 +2328,7 @@ class UnrealRemoteCalls:
         :param dict property_data: A dictionary representation of the properties.
         """
         skeletal_mesh = Unreal.get_asset(asset_path)
-        skeletal_mesh_subsystem = unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
+        skeletal_mesh_subsystem = Unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
         lod_count = skeletal_mesh_subsystem.get_lod_count(skeletal_mesh)
         if lod_count > 1:
             skeletal_mesh.remove_lo_ds(list(range(1, lod_count)))
@@ -1413,8 +2338,10 @@ class UnrealRemoteCalls:
             data_asset = Unreal.get_asset(asset_path)
             skeletal_mesh.lod_settings = data_asset
             skeletal_mesh_subsystem.regenerate_lod(skeletal_mesh, new_lod_count=lod_count)
+        Unreal.mark_dirty(skeletal_mesh)
 
     @staticmethod
+    @rpc.factory.mutates('asset_path')
     def reset_static_mesh_lods(asset_path):
         """
         Removes all lods on the given static mesh.
@@ -1422,12 +2349,14 @@ class UnrealRemoteCalls:
         :param str asset_path: The project path to the static mesh in unreal.
         """
         static_mesh = Unreal.get_asset(asset_path)
-        static_mesh_subsystem = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+        static_mesh_subsystem = Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
         lod_count = static_mesh_subsystem.get_lod_count(static_mesh)
         if lod_count > 1:
             static_mesh_subsystem.remove_lods(static_mesh)
+        Unreal.mark_dirty(static_mesh)
 
     @staticmethod
+    @rpc.factory.mutates('asset_path')
     def set_static_mesh_sockets(asset_path, asset_data):
         """
         Sets sockets on a static mesh.
@@ -1452,8 +2381,10 @@ class UnrealRemoteCalls:
 
             # create a new socket
             static_mesh.add_socket(socket)
+        Unreal.mark_dirty(static_mesh)
 
     @staticmethod
+    @rpc.factory.read_only('asset_path')
     def get_lod_build_settings(asset_path, index):
         """
         Gets the lod build settings from the given asset.
@@ -1467,14 +2398,39 @@ class UnrealRemoteCalls:
         if not mesh:
             raise RuntimeError(f'"{asset_path}" was not found in the unreal project!')
         if mesh.__class__.__name__ == 'SkeletalMesh':
-            skeletal_mesh_subsystem = unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
+            skeletal_mesh_subsystem = Unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
             build_settings = skeletal_mesh_subsystem.get_lod_build_settings(mesh, index)
         if mesh.__class__.__name__ == 'StaticMesh':
-            static_mesh_subsystem = unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+            static_mesh_subsystem = Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
             build_settings = static_mesh_subsystem.get_lod_build_settings(mesh, index)
 
         return Unreal.object_attributes_to_dict(build_settings)
 
+    @staticmethod
+    @rpc.factory.read_only('asset_paths')
+    def get_lods_build_settings(asset_paths):
+        """
+        Gets the build settings of every lod of many assets in one call.
+
+        :param list[str] asset_paths: The project paths to the assets.
+        :return dict: A dictionary of asset paths and a list of their lod build settings, in lod order.
+        """
+        lods_build_settings = {}
+        for asset_path in asset_paths:
+            mesh = Unreal.get_asset(asset_path)
+            if mesh.__class__.__name__ == 'SkeletalMesh':
+                mesh_subsystem = Unreal.get_editor_subsystem(unreal.SkeletalMeshEditorSubsystem)
+            elif mesh.__class__.__name__ == 'StaticMesh':
+                mesh_subsystem = Unreal.get_editor_subsystem(unreal.StaticMeshEditorSubsystem)
+            else:
+                raise RuntimeError(f'"{asset_path}" is not a static or skeletal mesh!')
+
+            lods_build_settings[asset_path] = [
+                Unreal.object_attributes_to_dict(mesh_subsystem.get_lod_build_settings(mesh, index))
+                for index in range(mesh_subsystem.get_lod_count(mesh))
+            ]
+        return lods_build_settings
+
     @staticmethod
     def get_bone_path_to_root(asset_path, bone_name):
         """
@@ -1518,6 +2474,74 @@ class UnrealRemoteCalls:
             'local_location': transform.translation.to_tuple()
         }
 
+    @staticmethod
+    def sample_bone_transforms(asset_path, bone_names, frame_range):
+        """
+        Samples the transformations of many bones over a range of frames. Each frame's pose is evaluated once, and
+        the world transforms of the requested bones are computed in one walk of the bone hierarchy, reusing the
+        world transforms of their shared ancestors.
+
+        The transforms are packed into flat lists of three floats per sample, ordered by frame and then by bone.
+
+        :param str asset_path: The project path to the asset.
+        :param list[str] bone_names: The names of the bones to get the transforms of.
+        :param list[int] frame_range: The first and last frame numbers to sample.
+        :return dict: A dictionary of the frames, bone names and packed transformation values.
+        """
+        animation = Unreal.get_asset(asset_path)
+
+        # the paths to the root only depend on the skeleton, so they are found once
+        bone_paths = {}
+        parents = {}
+        for bone_name in bone_names:
+            path = [str(bone) for bone in unreal.AnimationLibrary.find_bone_path_to_root(animation, bone_name)]
+            bone_paths[bone_name] = path
+            for bone, parent in zip(path, path[1:] + [None]):
+                parents.setdefault(bone, parent)
+
+        pose_options = unreal.AnimPoseEvaluationOptions()
+        pose_options.set_editor_property('extract_root_motion', True)
+
+        frames = list(range(frame_range[0], frame_range[1] + 1))
+        samples = {
+            'frames': frames,
+            'bone_names': list(bone_names),
+            'scale': [],
+            'world_rotation': [],
+            'local_rotation': [],
+            'world_location': [],
+            'local_location': []
+        }
+        for frame in frames:
+            pose = unreal.AnimPoseExtensions.get_anim_pose_at_frame(animation, frame, pose_options)
+            local_transforms = {}
+            world_transforms = {}
+            world_rotations = {}
+
+            for bone_name in bone_names:
+                # walk down from the root so that each parent's world transform is known before its children
+                for bone in reversed(bone_paths[bone_name]):
+                    if bone in world_transforms:
+                        continue
+                    transform = unreal.AnimPoseExtensions.get_bone_pose(pose, bone)
+                    local_transforms[bone] = transform
+                    parent = parents[bone]
+                    if parent is None:
+                        world_transforms[bone] = transform
+                        world_rotations[bone] = transform.rotation.rotator()
+                    else:
+                        world_transforms[bone] = transform.multiply(world_transforms[parent])
+                        world_rotations[bone] = transform.rotation.rotator().combine(world_rotations[parent])
+
+                transform = local_transforms[bone_name]
+                samples['scale'].extend(transform.scale3d.to_tuple())
+                samples['world_rotation'].extend(world_rotations[bone_name].transform().rotation.euler().to_tuple())
+                samples['local_rotation'].extend(transform.rotation.euler().to_tuple())
+                samples['world_location'].extend(world_transforms[bone_name].translation.to_tuple())
+                samples['local_location'].extend(transform.translation.to_tuple())
+
+        return samples
+
     @staticmethod
     def get_bone_count(skeleton_path):
         """
@@ -1526,10 +2550,11 @@ class UnrealRemoteCalls:
         :param str skeleton_path: The project path to the skeleton.
         :return int: The number of bones.
         """
-        skeleton = unreal.load_asset(skeleton_path)
+        skeleton = Unreal.load_asset(skeleton_path)
         return len(skeleton.get_editor_property('bone_tree'))
 
     @staticmethod
+    @rpc.factory.read_only('asset_path')
     def get_origin(asset_path):
         """
         Gets the location of the asset origin.
@@ -1541,6 +2566,7 @@ class UnrealRemoteCalls:
         return mesh.get_bounds().origin.to_tuple()
 
     @staticmethod
+    @rpc.factory.read_only('asset_path')
     def get_morph_target_names(asset_path):
         """
         Gets the name of the morph targets on the given asset.
@@ -1562,11 +2588,8 @@ class UnrealRemoteCalls:
         :param float frame: The frame number.
         :return dict: A dictionary of transformation values.
         """
-        sequence = unreal.load_asset(asset_path)
-        bindings = {binding.get_name(): binding for binding in sequence.get_bindings()}
-        binding = bindings.get(track_name)
-        track = binding.get_tracks()[0]
-        section = track.get_sections()[0]
+        sequence = Unreal.load_asset(asset_path)
+        section = Unreal.get_sequence_track_section(sequence, track_name)
         data = {}
         for channel in section.get_channels():
             if channel.get_name().startswith(curve_name):
@@ -1576,21 +2599,75 @@ class UnrealRemoteCalls:
         return data
 
     @staticmethod
+    def get_sequence_track_keyframes(asset_path, track_name, curve_name=''):
+        """
+        Gets all the keys on the channels of the given track. The keys of each channel are packed into a list of
+        frame times and a list of values.
+
+        :param str asset_path: The project path to the asset.
+        :param str track_name: The name of the track.
+        :param str curve_name: Only include the channels whose name starts with this curve name.
+        :return dict: A dictionary of the channel names and their frame times and values.
+        """
+        sequence = Unreal.get_asset(asset_path)
+        section = Unreal.get_sequence_track_section(sequence, track_name)
+        data = {
+            'channels': [],
+            'times': [],
+            'values': []
+        }
+        for channel in section.get_channels():
+            if channel.get_name().startswith(curve_name):
+                times = []
+                values = []
+                for key in channel.get_keys():
+                    key_time = key.get_time()
+                    times.append(key_time.frame_number.value + key_time.sub_frame)
+                    values.append(key.get_value())
+                data['channels'].append(channel.get_name())
+                data['times'].append(times)
+                data['values'].append(values)
+        return data
+
+    @staticmethod
+    @rpc.factory.mutates('asset_path')
+    def clear_sequence_track_keyframes(asset_path, track_name):
+        """
+        Removes all the keys from the channels of the given track in one editor transaction.
+
+        :param str asset_path: The project path to the asset.
+        :param str track_name: The name of the track.
+        :return int: The number of removed keys.
+        """
+        sequence = Unreal.get_asset(asset_path)
+        return Unreal.clear_section_keyframes(Unreal.get_sequence_track_section(sequence, track_name))
+
+    @staticmethod
+    @rpc.factory.mutates('asset_path')
     def import_animation_fcurves(asset_path, fcurve_file_path):
         """
-        Imports fcurves from a file onto an animation sequence.
+        Imports fcurves from a file onto an animation sequence. The file can either be a binary curve file or a
+        json file of curve names and their [time, value] keys.
 
         :param str asset_path: The project path to the skeletal mesh in unreal.
         :param str fcurve_file_path: The file path to the fcurve file.
         """
         animation_sequence = Unreal.get_asset(asset_path)
-        with open(fcurve_file_path, 'r') as fcurve_file:
-            fcurve_data = json.load(fcurve_file)
+        if curve_file.is_curve_file(fcurve_file_path):
+            curves = curve_file.read_curves(fcurve_file_path)
+        else:
+            with open(fcurve_file_path, 'r') as fcurve_file:
+                fcurve_data = json.load(fcurve_file)
+            curves = (
+                (fcurve_name, [key[0] for key in keys], [key[1] for key in keys])
+                for fcurve_name, keys in fcurve_data.items()
+            )
 
-        for fcurve_name, keys in fcurve_data.items():
+        # add all the keys of a curve at once
+        for fcurve_name, times, values in curves:
             unreal.AnimationLibrary.add_curve(animation_sequence, fcurve_name)
-            for key in keys:
-                unreal.AnimationLibrary.add_float_curve_key(animation_sequence, fcurve_name, key[0], key[1])
+            if times:
+                unreal.AnimationLibrary.add_float_curve_keys(animation_sequence, fcurve_name, times, values)
 
     @staticmethod
     def does_curve_exist(asset_path, curve_name):
@@ -1619,34 +2696,133 @@ class UnrealRemoteCalls:
         :param str label: The unreal actor label.
         """
         asset = Unreal.get_asset(asset_path)
-        actor_subsystem = unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
 
         # if the unique name is found delete it
         if Unreal.has_asset_actor_with_label(label):
             Unreal.delete_asset_actor_with_label(label)
 
-        # spawn the actor
-        actor = actor_subsystem.spawn_actor_from_object(
-            asset,
-            location,
-            rotation=rotation,
-            transient=False
-        )
-        actor.set_actor_label(label)
+        # spawn the actor and set its transforms
+        Unreal.spawn_asset_actor(asset, location, rotation, scale, label)
 
-        # set the transforms of the actor with the tag that matches the unique name
-        actor = Unreal.get_asset_actor_by_label(label)
-        if actor:
-            actor.set_actor_transform(
-                new_transform=unreal.Transform(
-                    location=location,
-                    rotation=rotation,
-                    scale=scale
-                ),
-                sweep=False,
-                teleport=True
+    @staticmethod
+    def instance_assets(asset_paths, labels, locations, rotations, scales):
+        """
+        Instances many assets into the active level in one editor transaction. Existing actors with the same labels
+        are replaced.
+
+        :param list[str] asset_paths: The project paths to the assets in unreal.
+        :param list[str] labels: The unreal actor labels.
+        :param list[list] locations: The unreal actor world locations.
+        :param list[list] rotations: The unreal actor world rotations.
+        :param list[list] scales: The unreal actor world scales.
+        :return list[str]: The labels of the spawned actors.
+        """
+        if not len(asset_paths) == len(labels) == len(locations) == len(rotations) == len(scales):
+            raise ValueError('The asset paths, labels, locations, rotations and scales must have the same length.')
+
+        # load each asset only once
+        assets = {asset_path: Unreal.get_asset(asset_path) for asset_path in set(asset_paths)}
+        actor_subsystem = Unreal.get_editor_subsystem(unreal.EditorActorSubsystem)
+        asset_actor_index = Unreal.get_asset_actor_index()
+
+        with unreal.ScopedEditorTransaction('Instance Assets'):
+            existing_actors = [asset_actor_index.pop(label) for label in set(labels) if label in asset_actor_index]
+            if existing_actors:
+                actor_subsystem.destroy_actors(existing_actors)
+
+            actors = []
+            for asset_path, label, location, rotation, scale in zip(asset_paths, labels, locations, rotations, scales):
+                actors.append(Unreal.spawn_asset_actor(assets[asset_path], location, rotation, scale, label))
+
+        return [actor.get_actor_label() for actor in actors]
+
+    @staticmethod
+    def instance_static_meshes(asset_paths, locations, rotations, scales, hierarchical=True, prune=False):
+        """
+        Places static meshes as instances, grouped by asset. Each asset gets one actor, found by the asset path in
+        its tags and labeled after the asset path, that holds all its placements on a single instanced static mesh
+        component. When the actor already exists, its instance transforms are updated in bulk instead of respawning
+        anything.
+
+        :param list[str] asset_paths: The project paths to the static meshes in unreal.
+        :param list[list] locations: The world locations of the instances.
+        :param list[list] rotations: The world rotations of the instances.
+        :param list[list] scales: The world scales of the instances.
+        :param bool hierarchical: Whether to use a HierarchicalInstancedStaticMeshComponent.
+        :param bool prune: Whether to delete the instances of the static meshes that are not in the given asset paths.
+        :return dict: A dictionary of the instance actor labels and their instance counts.
+        """
+        if not len(asset_paths) == len(locations) == len(rotations) == len(scales):
+            raise ValueError('The asset paths, locations, rotations and scales must have the same length.')
+
+        component_class = unreal.InstancedStaticMeshComponent
+        if hierarchical:
+            component_class = unreal.HierarchicalInstancedStaticMeshComponent
+
+        # group the instance transforms by asset
+        transforms = {}
+        for asset_path, location, rotation, scale in zip(asset_paths, locations, rotations, scales):
+            transforms.setdefault(asset_path.split('.')[0], []).append(
+                unreal.Transform(location=location, rotation=rotation, scale=scale)
             )
 
+        instance_counts = {}
+        instances_actor_index = Unreal.get_instances_actor_index()
+        with unreal.ScopedEditorTransaction('Instance Static Meshes'):
+            for asset_path, asset_transforms in transforms.items():
+                static_mesh = Unreal.get_asset(asset_path)
+                if static_mesh.__class__.__name__ != 'StaticMesh':
+                    raise RuntimeError(f'"{asset_path}" is not a static mesh and can not be instanced.')
+
+                # the label is made from the whole asset path, so meshes with the same name do not share it
+                label = f'{asset_path.strip("/").replace("/", "_")}_Instances'
+                actor = instances_actor_index.get(asset_path)
+                component = None
+                if actor:
+                    component = actor.get_component_by_class(unreal.InstancedStaticMeshComponent)
+
+                # replace actors that hold a different kind of instanced static mesh component
+                if actor and type(component) != component_class:
+                    Unreal.get_editor_subsystem(unreal.EditorActorSubsystem).destroy_actor(actor)
+                    component = None
+                if not component:
+                    actor = Unreal.spawn_instances_actor(asset_path, label, component_class)
+                    component = actor.get_component_by_class(component_class)
+                component.set_static_mesh(static_mesh)
+
+                # update the existing instances in place when the number of instances did not change
+                if component.get_instance_count() == len(asset_transforms):
+                    component.batch_update_instances_transforms(
+                        0,
+                        asset_transforms,
+                        world_space=True,
+                        mark_render_state_dirty=True,
+                        teleport=True
+                    )
+                else:
+                    component.clear_instances()
+                    component.add_instances(asset_transforms, False, world_space=True)
+                instance_counts[label] = len(asset_transforms)
+
+            # the instances of the static meshes that were removed from the sync are deleted in the same undo step
+            if prune:
+                Unreal.delete_instances_actors(keep_asset_paths=list(transforms))
+
+        # the holder actors are asset actors too, so their index is built again the next time it is needed
+        rpc.base_server.get_call_scope().pop('asset_actor_index', None)
+        return instance_counts
+
+    @staticmethod
+    def delete_instances(asset_paths=None):
+        """
+        Deletes the actors that hold the instances of static meshes, with all their instances.
+
+        :param list[str] asset_paths: The project paths to the static meshes whose instances should be deleted. The
+        instances of every static mesh are deleted if not provided.
+        :return list[str]: The project paths to the static meshes whose instances were deleted.
+        """
+        return Unreal.delete_instances_actors(asset_paths)
+
     @staticmethod
     def delete_all_asset_actors():
         """
@@ -1654,6 +2830,17 @@ class UnrealRemoteCalls:
         """
         Unreal.delete_all_asset_actors()
 
+    @staticmethod
+    def delete_asset_actors(labels=None, asset_paths=None):
+        """
+        Deletes the asset actors from the current level that match the given labels or asset paths.
+
+        :param list[str] labels: The labels of the actors to delete.
+        :param list[str] asset_paths: The project paths to the assets whose actors should be deleted.
+        :return int: The number of deleted actors.
+        """
+        return Unreal.delete_asset_actors(labels, asset_paths)
+
     @staticmethod
     def get_asset_actor_transforms(label):
         """
@@ -1671,3 +2858,44 @@ class UnrealRemoteCalls:
                 'rotation': root_component.get_world_rotation().to_tuple(),
                 'scale': root_component.get_world_scale().to_tuple(),
             }
+
+    @staticmethod
+    def get_asset_actors_transforms(labels=None, asset_paths=None):
+        """
+        Gets the transforms of the asset actors in the active level in one pass. Every asset actor is included, even
+        when several share a label. Actors that hold the instances of a static mesh are included once per instance.
+        The transforms are packed into flat lists of three floats per entry, in the same order as the returned labels.
+
+        :param list[str] labels: Only include actors with these labels. All asset actors are included if not provided.
+        :param list[str] asset_paths: Only include actors of these assets. All asset actors are included if not
+        provided.
+        :returns: A dictionary of the labels, asset paths, locations, rotations and scales.
+        :rtype: dict
+        """
+        labels = set(labels) if labels is not None else None
+        asset_paths = {asset_path.split('.')[0] for asset_path in asset_paths} if asset_paths is not None else None
+
+        result = {
+            'labels': [],
+            'asset_paths': [],
+            'locations': [],
+            'rotations': [],
+            'scales': []
+        }
+        for actor in Unreal.get_asset_actors_in_level():
+            label = actor.get_actor_label()
+            if labels is not None and label not in labels:
+                continue
+
+            assets = Unreal.get_assets_on_actor(actor)
+            asset_path = assets[0].get_path_name().split('.')[0] if assets else None
+            if asset_paths is not None and asset_path not in asset_paths:
+                continue
+
+            for location, rotation, scale in Unreal.get_actor_transforms(actor):
+                result['labels'].append(label)
+                result['asset_paths'].append(asset_path)
+                result['locations'].extend(location)
+                result['rotations'].extend(rotation)
+                result['scales'].extend(scale)
+        return result